@@ -5,8 +5,18 @@ This package provides a Python-based framework for orchestrating VM lifecycle
 management, automated interactions, and demo generation workflows.
 """
 
-from .session import startdemo, recordDemo
 from .exceptions import DemotoolError
 
 __version__ = "0.1.0"
 __all__ = ["startdemo", "recordDemo", "DemotoolError"]
+
+
+def __getattr__(name: str) -> object:
+    # PEP 562 lazy re-export: pulling in .session drags libvirt and the
+    # whole VM stack along, which CLI paths like --help and --version
+    # should not have to pay for
+    if name in ("startdemo", "recordDemo"):
+        from . import session
+
+        return getattr(session, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
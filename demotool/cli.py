@@ -4,14 +4,26 @@ Command-line interface for demotool.
 
 import argparse
 import sys
-from pathlib import Path
 
-from .logging import setup_logging
-from .session import startdemo, recordDemo
 
+def _wait_for_interrupt() -> None:
+    """Block until the user interrupts with Ctrl+C."""
+    import signal
 
-def main() -> int:
-    """Main CLI entry point."""
+    if hasattr(signal, "pause"):
+        # POSIX: sleep until a signal arrives, no periodic wakeups
+        signal.pause()
+    else:
+        # Windows has no signal.pause(); an unset Event blocks the same way
+        import threading
+        threading.Event().wait()
+
+
+SUBCOMMANDS = ("start", "record", "images")
+
+
+def _build_base_parser() -> argparse.ArgumentParser:
+    """Build the top-level argument parser (without subparsers)."""
     parser = argparse.ArgumentParser(
         description="Automated demo creation using virtual machines",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -31,29 +43,64 @@ Examples:
         """
     )
     
+    # Fallback so --version shows up in --help; the sniff in main() handles
+    # the common case without building any of this
+    from . import __version__
+    parser.add_argument("-V", "--version", action="version", version=__version__)
+
+    return parser
+
+
+def _build_subparser(name: str, subparsers) -> None:
+    """Build the subparser for a single subcommand."""
+    if name == "start":
+        start_parser = subparsers.add_parser("start", help="Start a demo session")
+        start_parser.add_argument("name", help="Demo session name")
+        start_parser.add_argument("image_id", help="Base image identifier (e.g., fedora-42)")
+        start_parser.add_argument("--timeout", type=int, default=120,
+                                 help="Boot timeout in seconds (default: 120)")
+    elif name == "record":
+        record_parser = subparsers.add_parser("record", help="Quick demo recording")
+        record_parser.add_argument("name", help="Demo session name")
+        record_parser.add_argument("image_id", help="Base image identifier (e.g., fedora-42)")
+        record_parser.add_argument("--timeout", type=int, default=120,
+                                  help="Boot timeout in seconds (default: 120)")
+    elif name == "images":
+        images_parser = subparsers.add_parser("images", help="Manage base images")
+        images_subparsers = images_parser.add_subparsers(dest="images_command", help="Image commands")
+
+        images_subparsers.add_parser("list", help="List available images")
+        images_subparsers.add_parser("cleanup", help="Clean up corrupted images")
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Find the first token in argv that names a known subcommand."""
+    for token in argv:
+        if token in SUBCOMMANDS:
+            return token
+    return None
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    # Fast path: answer version queries before building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        from . import __version__
+        print(__version__)
+        return 0
+
+    parser = _build_base_parser()
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Start command
-    start_parser = subparsers.add_parser("start", help="Start a demo session")
-    start_parser.add_argument("name", help="Demo session name")
-    start_parser.add_argument("image_id", help="Base image identifier (e.g., fedora-42)")
-    start_parser.add_argument("--timeout", type=int, default=120,
-                             help="Boot timeout in seconds (default: 120)")
-    
-    # Record command
-    record_parser = subparsers.add_parser("record", help="Quick demo recording")
-    record_parser.add_argument("name", help="Demo session name")
-    record_parser.add_argument("image_id", help="Base image identifier (e.g., fedora-42)")
-    record_parser.add_argument("--timeout", type=int, default=120,
-                              help="Boot timeout in seconds (default: 120)")
-    
-    # Images command
-    images_parser = subparsers.add_parser("images", help="Manage base images")
-    images_subparsers = images_parser.add_subparsers(dest="images_command", help="Image commands")
-    
-    images_list_parser = images_subparsers.add_parser("list", help="List available images")
-    images_cleanup_parser = images_subparsers.add_parser("cleanup", help="Clean up corrupted images")
-    
+
+    # Only build the subparser the user actually asked for; fall back to
+    # building all of them so -h and error messages list every subcommand
+    subcommand = _sniff_subcommand(sys.argv[1:])
+    if subcommand is not None:
+        _build_subparser(subcommand, subparsers)
+    else:
+        for name in SUBCOMMANDS:
+            _build_subparser(name, subparsers)
+
     # Parse arguments
     args = parser.parse_args()
     
@@ -61,7 +108,8 @@ Examples:
         parser.print_help()
         return 1
     
-    # Set up logging
+    # Set up logging (imported lazily so --help and argparse errors stay fast)
+    from .logging import setup_logging
     setup_logging()
     
     try:
@@ -85,6 +133,8 @@ Examples:
 
 def _handle_start(args) -> int:
     """Handle the start command."""
+    from .session import startdemo
+
     print(f"Starting demo session: {args.name}")
     print(f"Base image: {args.image_id}")
     
@@ -103,9 +153,7 @@ def _handle_start(args) -> int:
                 
                 # Keep the demo running until interrupted
                 try:
-                    while True:
-                        import time
-                        time.sleep(1)
+                    _wait_for_interrupt()
                 except KeyboardInterrupt:
                     print("\nStopping demo...")
         
@@ -119,6 +167,8 @@ def _handle_start(args) -> int:
 
 def _handle_record(args) -> int:
     """Handle the record command."""
+    from .session import recordDemo
+
     print(f"Starting quick demo recording: {args.name}")
     print(f"Base image: {args.image_id}")
     
@@ -134,9 +184,7 @@ def _handle_record(args) -> int:
             
             # Keep the demo running until interrupted
             try:
-                while True:
-                    import time
-                    time.sleep(1)
+                _wait_for_interrupt()
             except KeyboardInterrupt:
                 print("\nStopping demo...")
         
@@ -170,32 +218,44 @@ def _list_images() -> int:
         if not cache_dir.exists():
             print("No images found")
             return 0
-        
-        images = list(cache_dir.glob("*.qcow2"))
-        
-        if not images:
+
+        # scandir's DirEntry caches stat results from the directory read,
+        # saving a stat syscall per image compared to glob + stat
+        import os
+        from pathlib import Path
+
+        with os.scandir(cache_dir) as it:
+            entries = sorted(
+                (e for e in it
+                 if e.name.endswith(".qcow2")
+                 and not e.name.endswith(".overlay.qcow2")
+                 and e.is_file(follow_symlinks=False)),
+                key=lambda e: e.name
+            )
+
+        if not entries:
             print("No images found")
             return 0
-        
+
         print("Available base images:")
         print(f"{'Image':<30} {'Size':<15} {'Status'}")
         print("-" * 60)
-        
-        for image_path in sorted(images):
+
+        for entry in entries:
             try:
-                size = image_path.stat().st_size
+                size = entry.stat().st_size
                 size_mb = size / (1024 * 1024)
-                
-                if manager._is_valid_qcow2(image_path):
+
+                if manager._is_valid_qcow2(Path(entry.path)):
                     status = "Valid"
                 else:
                     status = "Corrupted"
-                
-                print(f"{image_path.name:<30} {size_mb:>8.1f}MB {status}")
-                
+
+                print(f"{entry.name:<30} {size_mb:>8.1f}MB {status}")
+
             except Exception as e:
-                print(f"{image_path.name:<30} {'Error':<15} {e}")
-        
+                print(f"{entry.name:<30} {'Error':<15} {e}")
+
         return 0
         
     except Exception as e:
@@ -212,7 +272,17 @@ def _cleanup_images() -> int:
         print("Cleaning up corrupted images...")
         
         manager.cleanup_corrupted_images()
-        
+
+        # Skeleton VMs left behind by a crashed warm pool are never
+        # reclaimed anywhere else
+        try:
+            from .vm import VMManager
+
+            VMManager().cleanup_stale_pool_vms()
+        except Exception as e:
+            print(f"Warning: could not clean up stale pool VMs: {e}",
+                  file=sys.stderr)
+
         print("Cleanup completed")
         return 0
         
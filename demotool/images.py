@@ -2,9 +2,13 @@
 Base image management for demotool.
 """
 
+import functools
+import json
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -15,15 +19,32 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Magic bytes at the start of every qcow2 file ("QFI\xfb")
+QCOW2_MAGIC = b"QFI\xfb"
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_cache_dir(xdg_root: str) -> Path:
+    """Resolve the image cache directory under an XDG cache root."""
+    return Path(xdg_root) / "demotool" / "images"
+
 
 class ImageManager:
     """Manages base VM images for demotool."""
-    
+
+    # Cache directories this process has already created; repeated manager
+    # construction skips the mkdir syscalls
+    _created_dirs: set[Path] = set()
+
     def __init__(self) -> None:
         """Initialize the image manager."""
-        self.cache_dir = Path(xdg.xdg_cache_home()) / "demotool" / "images"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Image cache directory: {self.cache_dir}")
+        self.cache_dir = _resolve_cache_dir(str(xdg.xdg_cache_home()))
+        if self.cache_dir not in ImageManager._created_dirs:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            ImageManager._created_dirs.add(self.cache_dir)
+        # Memoizes validation results per (path, mtime_ns, size)
+        self._valid_cache: dict[tuple[str, int, int], bool] = {}
+        logger.debug("Image cache directory: %s", self.cache_dir)
     
     def get_image_path(self, image_id: str) -> Path:
         """
@@ -47,55 +68,47 @@ class ImageManager:
         Returns:
             True if image exists and is valid, False otherwise
         """
-        image_path = self.get_image_path(image_id)
-        
-        if not image_path.exists():
-            return False
-        
-        # Check if file is readable
-        if not os.access(image_path, os.R_OK):
-            logger.warning(f"Image file not readable: {image_path}")
-            return False
-        
-        # Validate qcow2 format
-        try:
-            result = subprocess.run(
-                ["qemu-img", "info", str(image_path)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return "file format: qcow2" in result.stdout
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning(f"Failed to validate qcow2 format: {image_path}")
-            return False
+        # A single open-and-read covers every failure mode: a missing or
+        # unreadable file raises OSError inside the validator and a bad
+        # header fails the magic check, so no stat/access pre-checks needed
+        return self._is_valid_qcow2(self.get_image_path(image_id))
     
-    def create_image(self, image_id: str) -> Path:
+    def create_base_image(self, image_id: str) -> Path:
         """
-        Create a base image using virt-builder.
-        
+        Create a golden base image using virt-builder.
+
+        VMs should not boot from this image directly; give each one a CoW
+        overlay from create_overlay so the base stays pristine.
+
         Args:
             image_id: Base image identifier
-            
+
         Returns:
             Path to the created image
-            
+
         Raises:
             ImageError: If image creation fails
         """
         image_path = self.get_image_path(image_id)
-        
-        # Check if image already exists and is valid
-        if self.image_exists(image_id):
-            logger.info(f"Using existing image: {image_path}")
+
+        # One stat decides between reuse, rebuild-after-delete, and build
+        try:
+            image_path.stat()
+            exists = True
+        except FileNotFoundError:
+            exists = False
+
+        # Reuse the image if it's already built and valid
+        if exists and self._is_valid_qcow2(image_path):
+            logger.info("Using existing image: %s", image_path)
             return image_path
-        
+
         # Delete corrupted image if it exists
-        if image_path.exists():
-            logger.warning(f"Deleting corrupted image: {image_path}")
+        if exists:
+            logger.warning("Deleting corrupted image: %s", image_path)
             image_path.unlink()
-        
-        logger.info(f"Creating base image: {image_id}")
+
+        logger.info("Creating base image: %s", image_id)
         
         try:
             # Create temporary file in the same directory as the final destination
@@ -103,13 +116,26 @@ class ImageManager:
             cache_dir = image_path.parent
             cache_dir.mkdir(parents=True, exist_ok=True)
             
+            # The .partial suffix keeps half-built images out of the
+            # *.qcow2 globs used by listing and cleanup
             with tempfile.NamedTemporaryFile(
-                suffix=".qcow2", 
-                dir=str(cache_dir), 
+                prefix=f".{image_id}.",
+                suffix=".partial",
+                dir=str(cache_dir),
                 delete=False
             ) as tmp_file:
                 tmp_path = Path(tmp_file.name)
-            
+
+            # Write the firstboot setup as one script so the guest runs it
+            # in a single shell invocation at first boot
+            with tempfile.NamedTemporaryFile(
+                "w",
+                suffix=".sh",
+                delete=False
+            ) as script_file:
+                script_file.write(self._get_firstboot_script())
+                script_path = Path(script_file.name)
+
             # Build image using virt-builder
             cmd = [
                 "virt-builder",
@@ -117,14 +143,13 @@ class ImageManager:
                 "--output", str(tmp_path),
                 "--format", "qcow2",
                 "--install", "@workstation-product-environment",
-                "--firstboot-command", self._get_firstboot_commands(),
-                "--size", "100G",
+                "--firstboot", str(script_path),
                 "--root-password", "password:demokudasaidomo",
                 "--run-command", "systemctl enable gdm",
                 "--run-command", "systemctl set-default graphical.target"
             ]
             
-            logger.debug(f"Running virt-builder command: {' '.join(cmd)}")
+            logger.debug("Running virt-builder command: %s", cmd)
             
             result = subprocess.run(
                 cmd,
@@ -133,40 +158,127 @@ class ImageManager:
                 check=True
             )
             
-            # Move temporary file to final location (now guaranteed to work)
-            tmp_path.rename(image_path)
-            
-            logger.info(f"Successfully created image: {image_path}")
+            # Move temporary file to final location; os.replace is an atomic
+            # rename(2) on the same filesystem, even if the dest exists
+            os.replace(tmp_path, image_path)
+            self._invalidate_valid_cache(image_path)
+            script_path.unlink(missing_ok=True)
+
+            logger.info("Successfully created image: %s", image_path)
             return image_path
-            
+
         except subprocess.CalledProcessError as e:
-            logger.error(f"virt-builder failed: {e}")
-            logger.error(f"stdout: {e.stdout}")
-            logger.error(f"stderr: {e.stderr}")
-            
-            # Clean up temporary file
+            logger.error("virt-builder failed: %s", e)
+            logger.error("stdout: %s", e.stdout)
+            logger.error("stderr: %s", e.stderr)
+
+            # Clean up temporary files
             if 'tmp_path' in locals() and tmp_path.exists():
                 tmp_path.unlink()
-            
+            if 'script_path' in locals() and script_path.exists():
+                script_path.unlink()
+
             raise ImageError(f"Failed to create image {image_id}: {e}")
-        
+
         except Exception as e:
-            logger.error(f"Unexpected error creating image: {e}")
-            
-            # Clean up temporary file
+            logger.error("Unexpected error creating image: %s", e)
+
+            # Clean up temporary files
             if 'tmp_path' in locals() and tmp_path.exists():
                 tmp_path.unlink()
-            
+            if 'script_path' in locals() and script_path.exists():
+                script_path.unlink()
+
             raise ImageError(f"Failed to create image {image_id}: {e}")
     
-    def _get_firstboot_commands(self) -> str:
+    def create_overlay(self, base_path: Path, dest_path: Path) -> Path:
         """
-        Get the firstboot commands for setting up the demo user.
-        
+        Create a copy-on-write overlay image backed by a base image.
+
+        The overlay only stores blocks the VM writes, so creating it costs
+        kilobytes of I/O regardless of the base image size.
+
+        Args:
+            base_path: Path to the backing base image
+            dest_path: Path where the overlay should be created
+
         Returns:
-            Semicolon-separated command string
+            Path to the created overlay
+
+        Raises:
+            ImageError: If overlay creation fails
         """
-        commands = [
+        # Reuse an overlay left by a previous run when it's still backed
+        # by the right base image
+        if dest_path.exists() and self._overlay_matches(dest_path, base_path):
+            logger.debug("Reusing overlay %s backed by %s", dest_path, base_path)
+            return dest_path
+
+        # Build in a temp file next to the destination and publish with an
+        # atomic rename, so a crash mid-create can never leave a corrupt
+        # overlay at dest_path
+        with tempfile.NamedTemporaryFile(
+            prefix=f".{dest_path.name}.",
+            suffix=".partial",
+            dir=str(dest_path.parent),
+            delete=False
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+
+        try:
+            subprocess.run(
+                ["qemu-img", "create", "-f", "qcow2",
+                 "-F", "qcow2", "-b", str(base_path), str(tmp_path)],
+                capture_output=True,
+                check=True
+            )
+            os.replace(tmp_path, dest_path)
+        except subprocess.CalledProcessError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.error("qemu-img create failed: %s", e.stderr)
+            raise ImageError(f"Failed to create overlay for {base_path}: {e}")
+        except FileNotFoundError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise ImageError(f"Failed to create overlay for {base_path}: {e}")
+
+        logger.debug("Created overlay %s backed by %s", dest_path, base_path)
+        return dest_path
+
+    def _overlay_matches(self, overlay_path: Path, base_path: Path) -> bool:
+        """
+        Check whether an existing overlay is backed by the given base image.
+
+        Args:
+            overlay_path: Path to the candidate overlay
+            base_path: Expected backing image
+
+        Returns:
+            True if the overlay is a qcow2 backed by base_path
+        """
+        try:
+            result = subprocess.run(
+                ["qemu-img", "info", "--output=json", str(overlay_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True
+            )
+            info = json.loads(result.stdout)
+        except (subprocess.CalledProcessError, FileNotFoundError,
+                json.JSONDecodeError):
+            return False
+
+        return (info.get("format") == "qcow2"
+                and info.get("backing-filename") == str(base_path))
+
+    @staticmethod
+    def _firstboot_command_list() -> tuple[str, ...]:
+        """
+        Get the individual firstboot commands for setting up the demo user.
+
+        Returns:
+            Tuple of shell commands, in execution order
+        """
+        return (
             # Create demo user
             "useradd -m -s /bin/bash demo",
             # Set password
@@ -178,37 +290,149 @@ class ImageManager:
             "echo '[daemon]' > /etc/gdm/custom.conf.d/autologin.conf",
             "echo 'AutomaticLogin=demo' >> /etc/gdm/custom.conf.d/autologin.conf",
             "echo 'AutomaticLoginEnable=true' >> /etc/gdm/custom.conf.d/autologin.conf"
-        ]
-        
-        return "; ".join(commands)
+        )
+
+    @staticmethod
+    @functools.cache
+    def _get_firstboot_script() -> str:
+        """
+        Get the firstboot script for setting up the demo user.
+
+        Running one script means the guest forks a single shell at firstboot
+        instead of one per command. The script is pure and joined once, then
+        cached after the first call.
+
+        Returns:
+            Shell script text
+        """
+        commands = ImageManager._firstboot_command_list()
+        return "\n".join(["#!/bin/sh", "set -e", *commands]) + "\n"
     
-    def cleanup_corrupted_images(self) -> None:
-        """Remove any corrupted images from the cache."""
-        for image_file in self.cache_dir.glob("*.qcow2"):
-            if not self._is_valid_qcow2(image_file):
-                logger.warning(f"Removing corrupted image: {image_file}")
+    def cleanup_corrupted_images(self, deep: bool = False) -> None:
+        """
+        Remove any corrupted images from the cache.
+
+        Args:
+            deep: If True, validate with qemu-img instead of the fast
+                  magic-number check
+        """
+        check = self._deep_check_qcow2 if deep else self._is_valid_qcow2
+
+        # Pooled overlays that outlived their process are plain garbage, not
+        # base images; reap them instead of validating them. Both pools
+        # leave orphans: OverlayPool names ({id}.pool-*) and VMPool
+        # skeleton names (demo-pool-*)
+        orphans = chain(self.cache_dir.glob("*.pool-*.overlay.qcow2"),
+                        self.cache_dir.glob("demo-pool-*.overlay.qcow2"))
+        for orphan in orphans:
+            logger.info("Removing orphaned pooled overlay: %s", orphan)
+            try:
+                orphan.unlink()
+            except OSError as e:
+                logger.error("Failed to remove pooled overlay %s: %s", orphan, e)
+
+        # Per-VM overlays are disposable and recreated on demand; only base
+        # images are worth a corruption scan
+        image_files = [
+            p for p in self.cache_dir.glob("*.qcow2")
+            if not p.name.endswith(".overlay.qcow2")
+        ]
+        if not image_files:
+            return
+
+        # Each validation blocks on file or subprocess I/O, so checking the
+        # cache concurrently cuts wall-clock time to roughly the slowest image
+        with ThreadPoolExecutor(max_workers=min(8, len(image_files))) as executor:
+            results = list(executor.map(check, image_files))
+
+        for image_file, valid in zip(image_files, results):
+            if not valid:
+                logger.warning("Removing corrupted image: %s", image_file)
                 try:
                     image_file.unlink()
                 except OSError as e:
-                    logger.error(f"Failed to remove corrupted image {image_file}: {e}")
+                    logger.error("Failed to remove corrupted image %s: %s", image_file, e)
     
     def _is_valid_qcow2(self, image_path: Path) -> bool:
         """
         Check if a file is a valid qcow2 image.
-        
+
+        Only the file header's magic and version are checked; use
+        _deep_check_qcow2 for full validation. Results are memoized per
+        (path, mtime, size), so revalidating an unchanged file is a dict
+        lookup.
+
         Args:
             image_path: Path to the image file
-            
+
         Returns:
             True if valid qcow2, False otherwise
         """
+        try:
+            st = image_path.stat()
+            cache_key = (str(image_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._valid_cache:
+            return self._valid_cache[cache_key]
+
+        # qcow2 files start with the magic "QFI\xfb" followed by a big-endian
+        # version field; checking that in-process avoids a qemu-img subprocess
+        # spawn per image
+        try:
+            with open(image_path, "rb") as f:
+                header = f.read(8)
+        except OSError:
+            # Failing to open the file (e.g. a transient permission problem)
+            # says nothing about its contents, and fixing the permissions
+            # changes neither mtime nor size -- caching False here would
+            # stick for the life of the process
+            return False
+
+        if len(header) < 8 or header[:4] != QCOW2_MAGIC:
+            valid = False
+        else:
+            version = int.from_bytes(header[4:8], "big")
+            valid = version in (2, 3)
+
+        if cache_key is not None:
+            self._valid_cache[cache_key] = valid
+
+        return valid
+
+    def _deep_check_qcow2(self, image_path: Path) -> bool:
+        """
+        Thoroughly validate a qcow2 image using qemu-img.
+
+        Slower than the magic-number check in _is_valid_qcow2, but catches
+        images with a valid header and corrupted contents.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            True if qemu-img accepts the image as qcow2, False otherwise
+        """
         try:
             result = subprocess.run(
-                ["qemu-img", "info", str(image_path)],
-                capture_output=True,
-                text=True,
+                ["qemu-img", "info", "--output=json", str(image_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 check=True
             )
-            return "file format: qcow2" in result.stdout
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            return json.loads(result.stdout).get("format") == "qcow2"
+        except (subprocess.CalledProcessError, FileNotFoundError,
+                json.JSONDecodeError):
             return False
+
+    def _invalidate_valid_cache(self, image_path: Path) -> None:
+        """
+        Drop any cached validation results for the given path.
+
+        Args:
+            image_path: Path to the image file
+        """
+        path_str = str(image_path)
+        for key in [k for k in self._valid_cache if k[0] == path_str]:
+            del self._valid_cache[key]
@@ -7,19 +7,20 @@ import os
 import sys
 from typing import Optional
 
+# Level-name lookup; avoids per-call getattr resolution on the logging module
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
-class FileLineFormatter(logging.Formatter):
-    """Custom formatter that includes filename and line number."""
-    
-    def format(self, record: logging.LogRecord) -> str:
-        # Get the caller's filename and line number
-        if record.filename and record.lineno:
-            location = f"{record.filename}:{record.lineno}"
-        else:
-            location = "unknown:0"
-        
-        # Format: {level}: {filename}:{lineno}: {message}
-        return f"{record.levelname}: {location}: {record.getMessage()}"
+
+# Format: {level}: {filename}:{lineno}: {message}
+# Plain %-style fields keep record formatting inside logging's optimized
+# path instead of a per-record Python format() override
+LOG_FORMAT = "%(levelname)s: %(filename)s:%(lineno)d: %(message)s"
 
 
 def setup_logging(level: Optional[str] = None) -> None:
@@ -32,14 +33,24 @@ def setup_logging(level: Optional[str] = None) -> None:
     """
     if level is None:
         level = os.environ.get("DEMOTOOL_LOG_LEVEL", "INFO")
-    
+
     # Convert string level to logging constant
-    numeric_level = getattr(logging, level.upper(), None)
-    if not isinstance(numeric_level, int):
+    numeric_level = _LEVELS.get(level.upper())
+    if numeric_level is None:
         raise ValueError(f"Invalid log level: {level}")
-    
+
     # Create logger
     logger = logging.getLogger("demotool")
+
+    # While our handler is still the only one attached, reconfiguration
+    # is just a level update -- no handler churn
+    handler = getattr(logger, "_demotool_handler", None)
+    if handler is not None and logger.handlers == [handler]:
+        if logger.level != numeric_level:
+            logger.setLevel(numeric_level)
+            handler.setLevel(numeric_level)
+        return
+
     logger.setLevel(numeric_level)
     
     # Remove existing handlers to avoid duplicates
@@ -51,7 +62,7 @@ def setup_logging(level: Optional[str] = None) -> None:
     console_handler.setLevel(numeric_level)
     
     # Set formatter
-    formatter = FileLineFormatter()
+    formatter = logging.Formatter(LOG_FORMAT)
     console_handler.setFormatter(formatter)
     
     # Add handler to logger
@@ -60,6 +71,9 @@ def setup_logging(level: Optional[str] = None) -> None:
     # Prevent propagation to root logger
     logger.propagate = False
 
+    # Remember our handler so the early-return above can spot it
+    logger._demotool_handler = console_handler
+
 
 def get_logger(name: str) -> logging.Logger:
     """
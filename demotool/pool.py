@@ -0,0 +1,241 @@
+"""
+Pre-built overlay and warm-VM pooling for demotool.
+"""
+
+import atexit
+import queue
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+
+import libvirt
+
+from .exceptions import ImageError, VMError, VNCError
+from .images import ImageManager
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class OverlayPool:
+    """Pre-creates CoW overlay images in the background.
+
+    Keeps a small queue of ready-to-boot overlays per image_id so that
+    starting a VM doesn't have to wait for base-image lookup and overlay
+    creation on the critical path.
+    """
+
+    def __init__(self, image_manager: Optional[ImageManager] = None, size: int = 2):
+        """
+        Initialize the overlay pool.
+
+        Args:
+            image_manager: ImageManager to build overlays with; a new one is
+                           created when not given
+            size: Number of overlays to keep warm per image_id
+        """
+        self.image_manager = image_manager or ImageManager()
+        self.size = size
+        self._queues: dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _queue_for(self, image_id: str) -> queue.Queue:
+        """Get or create the overlay queue for an image_id."""
+        with self._lock:
+            q = self._queues.get(image_id)
+            if q is None:
+                q = self._queues[image_id] = queue.Queue(maxsize=self.size)
+            return q
+
+    def _new_overlay_path(self, image_id: str) -> Path:
+        """Reserve a unique overlay path in the image cache directory."""
+        with tempfile.NamedTemporaryFile(
+            prefix=f"{image_id}.pool-",
+            suffix=".overlay.qcow2",
+            dir=str(self.image_manager.cache_dir),
+            delete=False
+        ) as tmp_file:
+            return Path(tmp_file.name)
+
+    def _create_overlay(self, image_id: str) -> Path:
+        """Synchronously build one overlay for an image_id."""
+        base_path = self.image_manager.create_base_image(image_id)
+        return self.image_manager.create_overlay(
+            base_path, self._new_overlay_path(image_id)
+        )
+
+    def _fill(self, image_id: str) -> None:
+        """Top up the queue for an image_id; runs in a background thread."""
+        q = self._queue_for(image_id)
+        while not q.full():
+            try:
+                overlay_path = self._create_overlay(image_id)
+            except ImageError as e:
+                logger.warning("Failed to pre-create overlay for %s: %s", image_id, e)
+                return
+
+            try:
+                q.put_nowait(overlay_path)
+            except queue.Full:
+                overlay_path.unlink(missing_ok=True)
+                return
+
+            logger.debug("Pooled overlay for %s: %s", image_id, overlay_path)
+
+    def warm(self, image_id: str) -> None:
+        """Start filling the pool for an image_id in the background."""
+        threading.Thread(
+            target=self._fill, args=(image_id,), daemon=True
+        ).start()
+
+    def acquire(self, image_id: str) -> Path:
+        """
+        Get a ready overlay for an image_id.
+
+        Returns a pooled overlay when one is available, otherwise creates
+        one synchronously. Either way, a background refill is kicked off so
+        the next acquire finds a warm overlay.
+
+        Args:
+            image_id: Base image identifier (e.g., 'fedora-42')
+
+        Returns:
+            Path to an overlay backed by the image's base image
+        """
+        q = self._queue_for(image_id)
+        try:
+            overlay_path = q.get_nowait()
+            logger.debug("Using pooled overlay for %s: %s", image_id, overlay_path)
+        except queue.Empty:
+            overlay_path = self._create_overlay(image_id)
+
+        self.warm(image_id)
+        return overlay_path
+
+
+class VMPool:
+    """Keeps pre-booted "skeleton" VMs waiting at the login screen.
+
+    Booting a demo VM takes tens of seconds end to end. With a warm pool,
+    create_vm claims an already-booted domain instantly and the tens of
+    seconds move off the critical path into a background thread. Disabled
+    when size is 0 (the default), since every warm VM costs host RAM.
+    """
+
+    def __init__(self, vm_manager, size: int = 0):
+        """
+        Initialize the VM pool.
+
+        Args:
+            vm_manager: VMManager used to boot skeleton VMs
+            size: Number of VMs to keep warm per image_id; 0 disables pooling
+        """
+        self.vm_manager = vm_manager
+        self.size = size
+        self._queues: dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+        # The fill threads are daemons, so without this queued skeleton
+        # VMs would outlive the process as defined, running domains
+        if size > 0:
+            atexit.register(self.close)
+
+    def _queue_for(self, image_id: str) -> queue.Queue:
+        """Get or create the warm-VM queue for an image_id."""
+        with self._lock:
+            q = self._queues.get(image_id)
+            if q is None:
+                q = self._queues[image_id] = queue.Queue(maxsize=self.size)
+            return q
+
+    def close(self) -> None:
+        """Destroy any skeleton VMs still waiting in the pool.
+
+        Safe to call more than once; draining an empty pool is a no-op.
+        """
+        with self._lock:
+            queues = list(self._queues.values())
+
+        for q in queues:
+            while True:
+                try:
+                    vm, overlay_path, _ = q.get_nowait()
+                except queue.Empty:
+                    break
+                self.vm_manager._destroy_domain(vm, vm.name())
+                overlay_path.unlink(missing_ok=True)
+
+    def _boot_skeleton(self, image_id: str) -> Tuple[libvirt.virDomain, Path, int]:
+        """Synchronously boot one skeleton VM for an image_id."""
+        vm_name = f"demo-pool-{uuid.uuid4().hex[:8]}"
+        image_manager = self.vm_manager.image_manager
+
+        base_path = image_manager.create_base_image(image_id)
+        overlay_path = base_path.with_name(f"{vm_name}.overlay.qcow2")
+        image_manager.create_overlay(base_path, overlay_path)
+
+        try:
+            vm, vnc_port = self.vm_manager._boot_vm(vm_name, overlay_path)
+        except Exception:
+            overlay_path.unlink(missing_ok=True)
+            raise
+
+        return vm, overlay_path, vnc_port
+
+    def _fill(self, image_id: str) -> None:
+        """Top up the queue for an image_id; runs in a background thread."""
+        q = self._queue_for(image_id)
+        while not q.full():
+            try:
+                warm = self._boot_skeleton(image_id)
+            except (ImageError, VMError, VNCError) as e:
+                logger.warning("Failed to pre-boot VM for %s: %s", image_id, e)
+                return
+
+            try:
+                q.put_nowait(warm)
+            except queue.Full:
+                vm, overlay_path, _ = warm
+                self.vm_manager._destroy_domain(vm, vm.name())
+                overlay_path.unlink(missing_ok=True)
+                return
+
+            logger.debug("Pooled warm VM for %s: %s", image_id, warm[0].name())
+
+    def warm(self, image_id: str) -> None:
+        """Start filling the pool for an image_id in the background."""
+        if self.size <= 0:
+            return
+        threading.Thread(
+            target=self._fill, args=(image_id,), daemon=True
+        ).start()
+
+    def acquire(self, image_id: str) -> Optional[Tuple[libvirt.virDomain, Path, int]]:
+        """
+        Claim a warm VM for an image_id, if one is ready.
+
+        Unlike OverlayPool.acquire, this never boots synchronously: a miss
+        returns None and the caller falls back to the normal boot path. A
+        background refill is kicked off either way.
+
+        Args:
+            image_id: Base image identifier (e.g., 'fedora-42')
+
+        Returns:
+            Tuple of (libvirt domain, overlay path, VNC port), or None when
+            the pool is empty or disabled
+        """
+        if self.size <= 0:
+            return None
+
+        q = self._queue_for(image_id)
+        try:
+            warm = q.get_nowait()
+        except queue.Empty:
+            warm = None
+        else:
+            logger.debug("Claimed warm VM for %s: %s", image_id, warm[0].name())
+
+        self.warm(image_id)
+        return warm
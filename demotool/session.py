@@ -3,30 +3,47 @@ Demo session management for demotool.
 """
 
 import os
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 from .exceptions import SessionError
 from .logging import get_logger
+from .pool import OverlayPool
 from .vm import VMManager
 
 logger = get_logger(__name__)
 
+# Process-wide VMManager, shared across sessions so repeated startdemo()
+# calls don't redo libvirt connection setup
+_VM_MANAGER: Optional[VMManager] = None
+_VM_MANAGER_LOCK = threading.Lock()
+
+
+def _get_shared_vm_manager() -> VMManager:
+    """Get or create the process-wide VMManager instance."""
+    global _VM_MANAGER
+    with _VM_MANAGER_LOCK:
+        if _VM_MANAGER is None:
+            _VM_MANAGER = VMManager()
+        return _VM_MANAGER
+
 
 class DemoSession:
     """Manages a demo session and its output directory."""
-    
+
     def __init__(self, name: str):
         """
         Initialize demo session.
-        
+
         Args:
             name: Name of the demo session
         """
         self.name = name
         self._directory: Optional[Path] = None
         self._vm_manager: Optional[VMManager] = None
+        self._overlay_pool: Optional[OverlayPool] = None
         self._output_files_created = False
     
     @property
@@ -42,7 +59,7 @@ class DemoSession:
         if self._directory is None:
             # Create directory relative to current working directory
             self._directory = Path.cwd() / "demo-videos" / self.name
-            logger.debug(f"Demo directory path: {self._directory}")
+            logger.debug("Demo directory path: %s", self._directory)
         
         return self._directory
     
@@ -51,14 +68,22 @@ class DemoSession:
         if not self._output_files_created:
             self.directory.mkdir(parents=True, exist_ok=True)
             self._output_files_created = True
-            logger.info(f"Created demo output directory: {self.directory}")
+            logger.info("Created demo output directory: %s", self.directory)
     
     def _get_vm_manager(self) -> VMManager:
-        """Get or create VM manager instance."""
+        """Get the shared VM manager instance."""
         if self._vm_manager is None:
-            self._vm_manager = VMManager()
+            self._vm_manager = _get_shared_vm_manager()
         return self._vm_manager
-    
+
+    def _get_overlay_pool(self) -> OverlayPool:
+        """Get or create the overlay pool, sharing the VM manager's images."""
+        if self._overlay_pool is None:
+            self._overlay_pool = OverlayPool(
+                image_manager=self._get_vm_manager().image_manager
+            )
+        return self._overlay_pool
+
     @contextmanager
     def vm(self, image_id: str):
         """
@@ -76,8 +101,13 @@ class DemoSession:
                 print(f"VNC port: {vm.vnc_port}")
         """
         vm_manager = self._get_vm_manager()
-        
-        with vm_manager.create_vm(self.name, image_id) as vm_obj:
+
+        # Grab a pre-built overlay when the pool has one; acquire() also
+        # kicks off a background refill for the next VM
+        overlay_path = self._get_overlay_pool().acquire(image_id)
+
+        with vm_manager.create_vm(self.name, image_id,
+                                  overlay_path=overlay_path) as vm_obj:
             # Set the demo session reference
             vm_obj.demo = self
             yield vm_obj
@@ -97,17 +127,13 @@ class DemoSession:
         """
         self._ensure_directory_exists()
         file_path = self.directory / filename
-        logger.debug(f"Created output file: {file_path}")
+        logger.debug("Created output file: %s", file_path)
         return file_path
     
     def cleanup(self) -> None:
         """Clean up demo session resources."""
-        if self._vm_manager is not None:
-            try:
-                del self._vm_manager
-                self._vm_manager = None
-            except Exception as e:
-                logger.warning(f"Failed to cleanup VM manager: {e}")
+        # The VM manager is shared process-wide; just drop our reference
+        self._vm_manager = None
 
 
 @contextmanager
@@ -130,11 +156,11 @@ def startdemo(name: str):
     session = DemoSession(name)
     
     try:
-        logger.info(f"Started demo session: {name}")
+        logger.info("Started demo session: %s", name)
         yield session
     finally:
         session.cleanup()
-        logger.info(f"Ended demo session: {name}")
+        logger.info("Ended demo session: %s", name)
 
 
 # Convenience function for simple demo workflows
@@ -2,22 +2,138 @@
 VM lifecycle management for demotool.
 """
 
+import atexit
+import functools
+import hashlib
 import os
 import socket
+import string
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple
 
 import libvirt
-import psutil
 
 from .exceptions import VMError, VNCError
 from .images import ImageManager
 from .logging import get_logger
+from .pool import VMPool
 
 logger = get_logger(__name__)
 
+# Tracks the process-wide libvirt event loop thread
+_EVENT_LOOP_STARTED = False
+_EVENT_LOOP_LOCK = threading.Lock()
+
+# Shared libvirt connections, keyed by URI; libvirtd caps concurrent
+# clients, so all VMManager instances reuse one connection per URI
+_CONN_LOCK = threading.Lock()
+_SHARED_CONNS: dict[str, libvirt.virConnect] = {}
+
+# Domain XML skeleton; only the per-VM values are substituted at create time
+_VM_XML_TEMPLATE = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
+<domain type="kvm">
+  <name>$name</name>
+  <description>demotool-config:$config_hash</description>
+  <memory unit="MiB">$ram_mb</memory>
+  <currentMemory unit="MiB">$ram_mb</currentMemory>
+  <vcpu>$cpu_cores</vcpu>
+  <os>
+    <type arch="x86_64" machine="q35">hvm</type>
+    <boot dev="hd"/>
+  </os>
+  <features>
+    <acpi/>
+    <apic/>
+  </features>
+  <devices>
+    <disk type="file" device="disk">
+      <driver name="qemu" type="qcow2"/>
+      <source file="$image_path"/>
+      <target dev="vda" bus="virtio"/>
+    </disk>
+    <interface type="user">
+      <model type="virtio"/>
+    </interface>
+    <graphics type="vnc" port="-1" autoport="yes" listen="127.0.0.1"/>
+    <console type="pty"/>
+    <input type="tablet" bus="usb"/>
+    <input type="keyboard" bus="usb"/>
+  </devices>
+</domain>""")
+
+
+def _get_shared_connection(uri: str) -> libvirt.virConnect:
+    """Get (or open) the process-wide libvirt connection for a URI."""
+    with _CONN_LOCK:
+        conn = _SHARED_CONNS.get(uri)
+        if conn is not None:
+            try:
+                if conn.isAlive():
+                    return conn
+            except libvirt.libvirtError:
+                pass
+            # Dead connection; drop it and reopen below
+            _SHARED_CONNS.pop(uri, None)
+
+        conn = libvirt.open(uri)
+        _SHARED_CONNS[uri] = conn
+        logger.debug("Opened shared libvirt connection to %s", uri)
+        return conn
+
+
+@atexit.register
+def _close_shared_connections() -> None:
+    """Close any shared libvirt connections at interpreter exit."""
+    with _CONN_LOCK:
+        for conn in _SHARED_CONNS.values():
+            try:
+                conn.close()
+            except libvirt.libvirtError:
+                pass
+        _SHARED_CONNS.clear()
+
+
+def _mem_total_mb() -> int:
+    """
+    Read the host's total RAM in MB from /proc/meminfo.
+
+    Returns:
+        Total memory in MB
+    """
+    with open("/proc/meminfo") as f:
+        for line in f:
+            if line.startswith("MemTotal:"):
+                # Value is in kB: "MemTotal:       32658796 kB"
+                return int(line.split()[1]) // 1024
+    raise VMError("MemTotal not found in /proc/meminfo")
+
+
+def _run_event_loop() -> None:
+    """Dispatch libvirt events forever; runs in a daemon thread."""
+    while True:
+        libvirt.virEventRunDefaultImpl()
+
+
+def _ensure_event_loop() -> None:
+    """Start the libvirt event loop thread once per process.
+
+    Must run before the first libvirt.open() so that event callbacks
+    registered on connections are actually dispatched.
+    """
+    global _EVENT_LOOP_STARTED
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP_STARTED:
+            return
+        libvirt.virEventRegisterDefaultImpl()
+        threading.Thread(
+            target=_run_event_loop, name="libvirt-events", daemon=True
+        ).start()
+        _EVENT_LOOP_STARTED = True
+
 
 class VM:
     """Represents a VM instance for demotool."""
@@ -44,177 +160,291 @@ class VM:
 class VMManager:
     """Manages VM lifecycle and operations."""
     
-    def __init__(self) -> None:
-        """Initialize the VM manager."""
-        self.image_manager = ImageManager()
-        self.conn: Optional[libvirt.virConnect] = None
-        self._connect()
-    
+    def __init__(self, conn: Optional[libvirt.virConnect] = None,
+                 image_manager: Optional[ImageManager] = None) -> None:
+        """Initialize the VM manager.
+
+        No libvirt connection is opened here; the conn property connects
+        on first use, so constructing a manager stays cheap.
+
+        Args:
+            conn: libvirt connection to use instead of connecting lazily;
+                  lets tests and embedders share one connection outright
+            image_manager: ImageManager to use for base images and
+                           overlays; a new one is created if not given
+        """
+        self.image_manager = image_manager or ImageManager()
+        self._conn: Optional[libvirt.virConnect] = conn
+        # Warm skeleton-VM pool; disabled unless DEMOTOOL_WARM_VMS is set
+        self._vm_pool = VMPool(
+            self, size=int(os.environ.get("DEMOTOOL_WARM_VMS", "0"))
+        )
+
+    @property
+    def conn(self) -> libvirt.virConnect:
+        """The libvirt connection, opened lazily on first access."""
+        if self._conn is None:
+            self._connect()
+        return self._conn
+
+    @conn.setter
+    def conn(self, conn: Optional[libvirt.virConnect]) -> None:
+        self._conn = conn
+
     def _connect(self) -> None:
-        """Connect to libvirt."""
+        """Connect to libvirt via the shared per-URI connection."""
+        uri = os.environ.get("LIBVIRT_DEFAULT_URI", "qemu:///session")
         try:
-            self.conn = libvirt.open("qemu:///session")
-            logger.debug("Connected to libvirt qemu:///session")
+            _ensure_event_loop()
+            self._conn = _get_shared_connection(uri)
+            logger.debug("Connected to libvirt %s", uri)
         except libvirt.libvirtError as e:
-            logger.error(f"Failed to connect to libvirt: {e}")
+            logger.error("Failed to connect to libvirt: %s", e)
             raise VMError(f"Failed to connect to libvirt: {e}")
     
-    def _get_host_resources(self) -> Tuple[int, int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_host_resources() -> Tuple[int, int]:
         """
         Get host system resources.
-        
+
+        Host CPU and RAM don't change over a process lifetime, so the
+        result is computed once and cached.
+
         Returns:
             Tuple of (cpu_cores, ram_mb)
         """
         cpu_cores = os.cpu_count() or 1
-        ram_bytes = psutil.virtual_memory().total
-        ram_mb = ram_bytes // (1024 * 1024)
-        
+        ram_mb = _mem_total_mb()
+
         # Calculate 50% of host resources with limits
         vm_cpu = max(1, min(8, cpu_cores // 2))
         vm_ram = max(4096, min(32768, ram_mb // 2))
-        
-        logger.debug(f"Host: {cpu_cores} cores, {ram_mb}MB RAM")
-        logger.debug(f"VM allocation: {vm_cpu} cores, {vm_ram}MB RAM")
-        
+
+        logger.debug("Host: %s cores, %sMB RAM", cpu_cores, ram_mb)
+        logger.debug("VM allocation: %s cores, %sMB RAM", vm_cpu, vm_ram)
+
         return vm_cpu, vm_ram
-    
+
     def _create_vm_xml(self, name: str, image_path: Path, cpu_cores: int, ram_mb: int) -> str:
         """
         Generate libvirt XML for VM creation.
-        
+
         Args:
             name: VM name
             image_path: Path to base image
             cpu_cores: Number of CPU cores
             ram_mb: RAM in MB
-            
+
         Returns:
             XML string for VM definition
         """
-        xml_template = f"""<?xml version="1.0" encoding="UTF-8"?>
-<domain type="kvm">
-  <name>{name}</name>
-  <memory unit="MiB">{ram_mb}</memory>
-  <currentMemory unit="MiB">{ram_mb}</currentMemory>
-  <vcpu>{cpu_cores}</vcpu>
-  <os>
-    <type arch="x86_64" machine="q35">hvm</type>
-    <boot dev="hd"/>
-  </os>
-  <features>
-    <acpi/>
-    <apic/>
-  </features>
-  <devices>
-    <disk type="file" device="disk">
-      <driver name="qemu" type="qcow2"/>
-      <source file="{image_path}"/>
-      <target dev="vda" bus="virtio"/>
-    </disk>
-    <interface type="user">
-      <model type="virtio"/>
-    </interface>
-    <graphics type="vnc" port="-1" autoport="yes" listen="127.0.0.1"/>
-    <console type="pty"/>
-    <input type="tablet" bus="usb"/>
-    <input type="keyboard" bus="usb"/>
-  </devices>
-</domain>"""
-        
-        return xml_template
+        return _VM_XML_TEMPLATE.substitute(
+            name=name,
+            config_hash=self._config_hash(name, image_path, cpu_cores, ram_mb),
+            image_path=image_path,
+            cpu_cores=cpu_cores,
+            ram_mb=ram_mb,
+        )
+
+    @staticmethod
+    def _config_hash(name: str, image_path: Path, cpu_cores: int, ram_mb: int) -> str:
+        """
+        Hash the values that determine a domain's XML definition.
+
+        The hash is embedded in the domain <description> at define time so
+        a later run can tell whether an existing definition still matches.
+
+        Args:
+            name: VM name
+            image_path: Path to the boot image
+            cpu_cores: Number of CPU cores
+            ram_mb: RAM in MB
+
+        Returns:
+            Hex digest identifying the configuration
+        """
+        key = f"{name}|{image_path}|{cpu_cores}|{ram_mb}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _find_reusable_vm(self, vm_name: str, config_hash: str) -> Optional[libvirt.virDomain]:
+        """
+        Find an existing inactive domain whose definition already matches.
+
+        A match means the destroy/undefine/defineXML round-trips can all be
+        skipped and the domain simply started again.
+
+        Args:
+            vm_name: VM name to look up
+            config_hash: Expected configuration hash
+
+        Returns:
+            The reusable domain, or None when there is no match
+        """
+        try:
+            existing = self.conn.lookupByName(vm_name)
+            if existing.isActive():
+                return None
+            xml = existing.XMLDesc(libvirt.VIR_DOMAIN_XML_INACTIVE)
+        except libvirt.libvirtError:
+            return None
+
+        if f"demotool-config:{config_hash}" not in xml:
+            return None
+
+        logger.debug("Existing domain %s matches current config", vm_name)
+        return existing
     
     def _wait_for_vnc_port(self, vm: libvirt.virDomain, timeout: int = 120) -> int:
         """
-        Wait for VNC port to become available.
-        
+        Wait for the VM to start and return its VNC port.
+
+        Event-driven: a lifecycle-event callback wakes us the moment libvirt
+        reports the domain started, instead of polling and re-parsing the
+        domain XML every second.
+
         Args:
             vm: libvirt domain object
             timeout: Timeout in seconds
-            
+
         Returns:
             VNC port number
-            
+
         Raises:
             VNCError: If VNC port doesn't become available within timeout
         """
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        started = threading.Event()
+
+        def _on_lifecycle_event(conn, dom, event, detail, opaque):
+            if event == libvirt.VIR_DOMAIN_EVENT_STARTED:
+                started.set()
+
+        callback_id = self.conn.domainEventRegisterAny(
+            vm, libvirt.VIR_DOMAIN_EVENT_ID_LIFECYCLE, _on_lifecycle_event, None
+        )
+
+        try:
+            # The domain may have started before the callback was registered
             try:
-                # Get VNC port from libvirt
-                xml_desc = vm.XMLDesc()
-                if 'graphics type="vnc"' in xml_desc:
-                    # Extract port from XML - handle multi-line format
-                    for line in xml_desc.split('\n'):
-                        if 'graphics type="vnc"' in line:
-                            # Check if this line has port information
-                            if 'port=' in line:
-                                if 'autoport="yes"' in line:
-                                    # Port is auto-allocated, need to get it from libvirt
-                                    port = vm.vncDisplay()
-                                    if port is not None:
-                                        logger.info(f"VNC port allocated: {port}")
-                                        return port
-                                else:
-                                    # Port is explicitly set
-                                    import re
-                                    match = re.search(r'port="(\d+)"', line)
-                                    if match:
-                                        port = int(match.group(1))
-                                        logger.info(f"VNC port: {port}")
-                                        return port
-                            else:
-                                # This line has graphics type but no port, check for autoport
-                                if 'autoport="yes"' in line:
-                                    # Port is auto-allocated, need to get it from libvirt
-                                    port = vm.vncDisplay()
-                                    if port is not None:
-                                        logger.info(f"VNC port allocated: {port}")
-                                        return port
-                
-                time.sleep(1)
-                
+                if vm.state()[0] == libvirt.VIR_DOMAIN_RUNNING:
+                    started.set()
             except libvirt.libvirtError as e:
-                logger.debug(f"Waiting for VNC port: {e}")
-                time.sleep(1)
-        
-        raise VNCError(f"VNC port not available within {timeout} seconds")
+                logger.debug("Could not query initial domain state: %s", e)
+
+            if not started.wait(timeout):
+                raise VNCError(f"VNC port not available within {timeout} seconds")
+
+            # Once the domain is up, libvirt knows the auto-allocated port
+            port = vm.vncDisplay()
+            if port is None:
+                raise VNCError(f"VNC port not available within {timeout} seconds")
+
+            logger.info("VNC port allocated: %s", port)
+            return port
+
+        finally:
+            try:
+                self.conn.domainEventDeregisterAny(callback_id)
+            except libvirt.libvirtError as e:
+                logger.debug("Failed to deregister lifecycle callback: %s", e)
     
-    def _wait_for_desktop_ready(self, vnc_port: int, timeout: int = 120) -> None:
+    @staticmethod
+    def _recv_exact(sock: socket.socket, count: int) -> Optional[bytes]:
         """
-        Wait for desktop to be ready by checking VNC connectivity.
-        
+        Read exactly count bytes from a socket.
+
+        Args:
+            sock: Connected socket
+            count: Number of bytes to read
+
+        Returns:
+            The bytes read, or None if the peer closed the connection early
+        """
+        data = b""
+        while len(data) < count:
+            chunk = sock.recv(count - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    @classmethod
+    def _rfb_handshake(cls, sock: socket.socket) -> bool:
+        """
+        Complete a VNC (RFB 3.8) handshake up to ServerInit.
+
+        A successful TCP connect only proves QEMU bound the port; a server
+        that answers the full handshake with ServerInit is actually
+        serving the display.
+
+        Args:
+            sock: Connected socket to the VNC port
+
+        Returns:
+            True if the server completed the handshake
+        """
+        sock.settimeout(2)
+        try:
+            banner = cls._recv_exact(sock, 12)
+            if banner is None or not banner.startswith(b"RFB "):
+                return False
+            sock.sendall(b"RFB 003.008\n")
+
+            # Security types: a count byte followed by the type list;
+            # count 0 means the server is refusing the connection
+            count_byte = cls._recv_exact(sock, 1)
+            if count_byte is None or count_byte[0] == 0:
+                return False
+            security_types = cls._recv_exact(sock, count_byte[0])
+            if security_types is None or 1 not in security_types:
+                return False
+
+            # Pick type 1 (None auth) and check the SecurityResult
+            sock.sendall(b"\x01")
+            if cls._recv_exact(sock, 4) != b"\x00\x00\x00\x00":
+                return False
+
+            # ClientInit (shared flag), then ServerInit proves the display
+            # is up: framebuffer geometry, pixel format and name length
+            sock.sendall(b"\x01")
+            return cls._recv_exact(sock, 24) is not None
+        except OSError:
+            return False
+
+    def _wait_for_desktop_ready(self, vnc_port: int, timeout: float = 120) -> None:
+        """
+        Wait for desktop to be ready by completing a VNC handshake.
+
+        Probes protocol state instead of sleeping a fixed grace period
+        after connect, so a fast-booting desktop is detected immediately.
+        Retries back off exponentially from 50ms to a 500ms cap: a connect
+        to a non-listening port fails immediately with ECONNREFUSED, so
+        tight early retries cost nothing and cut mean detection latency.
+
         Args:
             vnc_port: VNC port number
             timeout: Timeout in seconds
-            
+
         Raises:
             VNCError: If desktop doesn't become ready within timeout
         """
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+
+        while time.monotonic() < deadline:
             try:
-                # Try to connect to VNC port
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex(('127.0.0.1', vnc_port))
-                sock.close()
-                
-                if result == 0:
-                    logger.info(f"VNC port {vnc_port} is responsive")
-                    # Add 10-second delay to allow desktop to fully load
-                    logger.info("Waiting 10 seconds for desktop to fully load...")
-                    time.sleep(10)
-                    return
-                
-            except Exception as e:
-                logger.debug(f"VNC check failed: {e}")
-            
-            time.sleep(2)
-        
-        raise VNCError(f"Desktop not ready within {timeout} seconds")
+                with socket.create_connection(("127.0.0.1", vnc_port),
+                                              timeout=1) as sock:
+                    if self._rfb_handshake(sock):
+                        logger.info("VNC server ready on port %s", vnc_port)
+                        return
+            except OSError as e:
+                logger.debug("VNC check failed: %s", e)
+
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        raise VNCError(f"Desktop not ready within {timeout:g} seconds")
     
     def _delete_existing_vm(self, name: str) -> None:
         """
@@ -223,109 +453,294 @@ class VMManager:
         Args:
             name: VM name to delete
         """
+        try:
+            # One list RPC plus a set membership test, instead of using a
+            # lookupByName exception as the existence check
+            if name not in {d.name() for d in self.conn.listAllDomains()}:
+                return
+        except libvirt.libvirtError as e:
+            # Fall through to the lookup below
+            logger.debug("Could not list domains: %s", e)
+
         try:
             existing_vm = self.conn.lookupByName(name)
-            logger.info(f"Deleting existing VM: {name}")
+            logger.info("Deleting existing VM: %s", name)
             
             # Try to destroy if running, but continue even if it fails
             if existing_vm.isActive():
                 try:
                     existing_vm.destroy()
                 except libvirt.libvirtError as e:
-                    logger.warning(f"Failed to destroy VM {name}: {e}")
+                    logger.warning("Failed to destroy VM %s: %s", name, e)
                     # Continue with undefine even if destroy fails
-            
+
+            # A leftover managed-save image (from _shelve_domain) blocks a
+            # plain undefine(), so drop it first
+            if existing_vm.hasManagedSaveImage():
+                existing_vm.managedSaveRemove()
+
             # Always try to undefine
             existing_vm.undefine()
-            logger.info(f"Successfully deleted VM: {name}")
+            logger.info("Successfully deleted VM: %s", name)
             
         except libvirt.libvirtError:
             # VM doesn't exist, which is fine
             pass
-    
+
+    def _prepare_overlay(self, vm_name: str, image_id: str) -> Path:
+        """
+        Get or create the base image and build the VM's own CoW overlay.
+
+        Args:
+            vm_name: libvirt domain name, used to name the overlay
+            image_id: Base image identifier
+
+        Returns:
+            Path to the overlay the VM should boot from
+        """
+        base_path = self.image_manager.create_base_image(image_id)
+        overlay_path = base_path.with_name(f"{vm_name}.overlay.qcow2")
+        return self.image_manager.create_overlay(base_path, overlay_path)
+
+    def _destroy_domain(self, vm: libvirt.virDomain, vm_name: str) -> None:
+        """
+        Destroy and undefine a domain, logging rather than raising on failure.
+
+        Args:
+            vm: libvirt domain object
+            vm_name: VM name, for log messages
+        """
+        try:
+            logger.info("Cleaning up VM: %s", vm_name)
+            if vm.isActive():
+                vm.destroy()
+            if vm.hasManagedSaveImage():
+                vm.managedSaveRemove()
+            vm.undefine()
+            logger.info("Successfully cleaned up VM: %s", vm_name)
+        except libvirt.libvirtError as e:
+            logger.error("Failed to clean up VM %s: %s", vm_name, e)
+
+    def cleanup_stale_pool_vms(self) -> None:
+        """
+        Destroy leftover demo-pool-* skeleton VMs from earlier runs.
+
+        Skeleton VMs carry throwaway uuid names, so any that survived a
+        previous process (a crash, a SIGKILL) are garbage: nothing will
+        ever claim or reuse them.
+        """
+        try:
+            domains = self.conn.listAllDomains()
+        except libvirt.libvirtError as e:
+            logger.warning("Could not list domains for pool cleanup: %s", e)
+            return
+
+        for domain in domains:
+            try:
+                name = domain.name()
+            except libvirt.libvirtError:
+                continue
+            if name.startswith("demo-pool-"):
+                logger.info("Reclaiming stale pool VM: %s", name)
+                self._destroy_domain(domain, name)
+
+    def _shelve_domain(self, vm: libvirt.virDomain, vm_name: str) -> bool:
+        """
+        Suspend a domain to disk with managedSave, if enabled.
+
+        A managed-save image lets the next create() resume the booted VM
+        in seconds instead of booting from scratch. Set
+        DEMOTOOL_NO_MANAGED_SAVE to force clean boots.
+
+        Args:
+            vm: libvirt domain object
+            vm_name: VM name, for log messages
+
+        Returns:
+            True if the domain state was saved
+        """
+        if os.environ.get("DEMOTOOL_NO_MANAGED_SAVE"):
+            return False
+
+        try:
+            if not vm.isActive():
+                return False
+            logger.info("Saving VM state: %s", vm_name)
+            vm.managedSave()
+            return True
+        except libvirt.libvirtError as e:
+            logger.warning("Failed to save state of VM %s: %s", vm_name, e)
+            return False
+
+    def _boot_vm(self, vm_name: str, overlay_path: Path,
+                 existing: Optional[libvirt.virDomain] = None) -> Tuple[libvirt.virDomain, int]:
+        """
+        Define, start and wait for a VM booted from an overlay.
+
+        Used both on the create_vm critical path and by the skeleton-VM
+        pool. A partially created domain is torn down before any error
+        propagates.
+
+        Args:
+            vm_name: libvirt domain name
+            overlay_path: Overlay image the VM boots from
+            existing: Matching inactive domain to start instead of defining
+                      a new one (see _find_reusable_vm)
+
+        Returns:
+            Tuple of (libvirt domain, VNC port)
+        """
+        if existing is not None:
+            logger.info("Reusing existing definition for VM: %s", vm_name)
+            vm = existing
+        else:
+            cpu_cores, ram_mb = self._get_host_resources()
+            xml = self._create_vm_xml(vm_name, overlay_path, cpu_cores, ram_mb)
+
+            logger.info("Creating VM: %s", vm_name)
+            vm = self.conn.defineXML(xml)
+
+        try:
+            logger.info("Starting VM: %s", vm_name)
+            vm.create()
+
+            # Both waits draw on one shared deadline, so the worst case is
+            # a single timeout rather than the sum of per-wait timeouts
+            timeout = int(os.environ.get("DEMOTOOL_BOOT_TIMEOUT", "120"))
+            deadline = time.monotonic() + timeout
+
+            # Wait for VNC port; this also waits (event-driven) for the
+            # domain to reach the running state
+            vnc_port = self._wait_for_vnc_port(vm, timeout)
+
+            # Wait for desktop to be ready within the remaining budget
+            self._wait_for_desktop_ready(
+                vnc_port, max(deadline - time.monotonic(), 1)
+            )
+        except Exception:
+            self._destroy_domain(vm, vm_name)
+            raise
+
+        return vm, vnc_port
+
     @contextmanager
-    def create_vm(self, demo_name: str, image_id: str):
+    def create_vm(self, demo_name: str, image_id: str,
+                  overlay_path: Optional[Path] = None):
         """
         Create and manage a VM instance.
-        
+
         Args:
             demo_name: Name of the demo session
             image_id: Base image identifier (e.g., 'fedora-42')
-            
+            overlay_path: Pre-created overlay to boot from (e.g. from an
+                          OverlayPool); it is renamed onto the VM's own
+                          deterministic overlay path. One is created on
+                          demand when omitted
+
         Yields:
             VM object when ready
-            
+
         Raises:
             VMError: If VM creation fails
         """
         vm_name = f"demo-{demo_name}"
         vm: Optional[libvirt.virDomain] = None
-        
+        from_pool = False
+        # Captured up front so the caller's pooled overlay is cleaned up on
+        # every path it isn't consumed on -- including a warm-VM claim,
+        # which boots from the skeleton's own overlay instead
+        pooled_overlay = overlay_path
+
         try:
-            # Delete existing VM if found
-            self._delete_existing_vm(vm_name)
-            
-            # Get or create base image
-            image_path = self.image_manager.create_image(image_id)
-            
-            # Get host resources
-            cpu_cores, ram_mb = self._get_host_resources()
-            
-            # Create VM XML
-            xml = self._create_vm_xml(vm_name, image_path, cpu_cores, ram_mb)
-            
-            # Create and start VM
-            logger.info(f"Creating VM: {vm_name}")
-            vm = self.conn.defineXML(xml)
-            
-            logger.info(f"Starting VM: {vm_name}")
-            vm.create()
-            
-            # Wait for VM to be running
-            start_time = time.time()
-            timeout = int(os.environ.get("DEMOTOOL_BOOT_TIMEOUT", "120"))
-            
-            while time.time() - start_time < timeout:
-                if vm.state()[0] == libvirt.VIR_DOMAIN_RUNNING:
-                    break
-                time.sleep(1)
+            # A warm skeleton VM skips defining, booting and all the waits;
+            # acquire() also kicks off a background refill for the next demo
+            warm = self._vm_pool.acquire(image_id)
+            if warm is not None:
+                vm, overlay_path, vnc_port = warm
+                vm_name = vm.name()
+                from_pool = True
+                logger.info("Claimed warm VM %s for demo %s", vm_name, demo_name)
             else:
-                raise VMError(f"VM failed to start within {timeout} seconds")
-            
-            logger.info(f"VM {vm_name} is running")
-            
-            # Wait for VNC port
-            vnc_port = self._wait_for_vnc_port(vm, timeout)
-            
-            # Wait for desktop to be ready
-            self._wait_for_desktop_ready(vnc_port, timeout)
-            
-            logger.info(f"VM {vm_name} is ready")
-            
+                # The overlay path is deterministic (a pooled overlay gets
+                # renamed onto it below), so the domain config hash is
+                # stable across runs and domain reuse / managed-save resume
+                # can actually trigger
+                overlay_path = self.image_manager.get_image_path(
+                    image_id
+                ).with_name(f"{vm_name}.overlay.qcow2")
+
+                cpu_cores, ram_mb = self._get_host_resources()
+                config_hash = self._config_hash(
+                    vm_name, overlay_path, cpu_cores, ram_mb
+                )
+
+                # Overlay preparation is disk I/O and stale-VM handling is
+                # libvirt RPCs; they're independent, so overlap them
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    overlay_future = (
+                        executor.submit(self._prepare_overlay, vm_name, image_id)
+                        if pooled_overlay is None else None
+                    )
+
+                    # A leftover domain whose definition already matches can
+                    # be started as-is; anything else gets deleted
+                    existing = self._find_reusable_vm(vm_name, config_hash)
+                    if existing is None:
+                        self._delete_existing_vm(vm_name)
+
+                    if overlay_future is not None:
+                        overlay_path = overlay_future.result()
+
+                if pooled_overlay is not None:
+                    if existing is not None:
+                        # The reused domain resumes from its own overlay;
+                        # the pooled one is surplus
+                        pooled_overlay.unlink(missing_ok=True)
+                    else:
+                        # Publish the pooled overlay under the VM's name
+                        os.replace(pooled_overlay, overlay_path)
+                    pooled_overlay = None
+
+                vm, vnc_port = self._boot_vm(vm_name, overlay_path,
+                                             existing=existing)
+
+            logger.info("VM %s is ready", vm_name)
+
             # Create VM object and yield it
             vm_obj = VM(demo_name, vnc_port, None)  # demo_session will be set by caller
             yield vm_obj
-            
+
         except Exception as e:
-            logger.error(f"Failed to create VM {vm_name}: {e}")
+            logger.error("Failed to create VM %s: %s", vm_name, e)
             raise VMError(f"Failed to create VM {vm_name}: {e}")
-        
+
         finally:
-            # Clean up VM
-            if vm is not None:
+            # Suspending the VM to disk lets the next run resume it in
+            # seconds instead of booting from scratch; the domain
+            # definition and overlay are kept around for that resume.
+            # Pool-claimed VMs carry throwaway uuid names that
+            # _find_reusable_vm never looks up, so shelving one would just
+            # leak the domain, its overlay and a guest-RAM-sized save file
+            saved = (vm is not None and not from_pool
+                     and self._shelve_domain(vm, vm_name))
+
+            if vm is not None and not saved:
+                self._destroy_domain(vm, vm_name)
+
+            # Remove the per-VM overlay; the base image is kept for reuse
+            if not saved and overlay_path is not None and overlay_path.exists():
                 try:
-                    logger.info(f"Cleaning up VM: {vm_name}")
-                    if vm.isActive():
-                        vm.destroy()
-                    vm.undefine()
-                    logger.info(f"Successfully cleaned up VM: {vm_name}")
-                except libvirt.libvirtError as e:
-                    logger.error(f"Failed to clean up VM {vm_name}: {e}")
+                    overlay_path.unlink()
+                except OSError as e:
+                    logger.warning("Failed to remove overlay %s: %s", overlay_path, e)
+
+            # A pooled overlay that never made it onto the VM's own path
+            # (an error before the rename) would otherwise be orphaned
+            if pooled_overlay is not None:
+                try:
+                    pooled_overlay.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(
+                        "Failed to remove pooled overlay %s: %s", pooled_overlay, e
+                    )
     
-    def __del__(self) -> None:
-        """Cleanup when VM manager is destroyed."""
-        if self.conn is not None:
-            try:
-                self.conn.close()
-            except Exception:
-                pass
@@ -6,6 +6,7 @@ This script demonstrates the basic usage of demotool for creating
 automated demos with virtual machines.
 """
 
+import signal
 import time
 from pathlib import Path
 
@@ -13,6 +14,17 @@ from pathlib import Path
 import demotool
 
 
+def wait_for_interrupt():
+    """Block until Ctrl+C without waking up once per second."""
+    try:
+        signal.pause()  # sleeps until a signal arrives
+    except AttributeError:
+        # signal.pause() is POSIX-only; an Event that never fires blocks
+        # just as quietly on other platforms
+        import threading
+        threading.Event().wait()
+
+
 def basic_demo():
     """Basic demo workflow."""
     print("Starting basic demo...")
@@ -37,8 +49,7 @@ def basic_demo():
             # Simulate some demo work
             print("Demo is running... (press Ctrl+C to stop)")
             try:
-                while True:
-                    time.sleep(1)
+                wait_for_interrupt()
             except KeyboardInterrupt:
                 print("\nDemo interrupted by user")
     
@@ -57,8 +68,7 @@ def quick_demo():
         # Simulate demo work
         print("Quick demo is running... (press Ctrl+C to stop)")
         try:
-            while True:
-                time.sleep(1)
+            wait_for_interrupt()
         except KeyboardInterrupt:
             print("\nQuick demo interrupted by user")
     
@@ -76,26 +86,24 @@ def multi_section_demo():
             print(f"VM is ready!")
             print(f"VNC port: {vm.vnc_port}")
             
-            # Section 1: Setup
-            print("\n=== Section 1: Setup ===")
-            setup_file = demo.create_output_file("setup.txt")
-            with open(setup_file, "w") as f:
-                f.write("Setup phase completed\n")
-            print("Setup phase completed")
-            
-            # Section 2: Main demo
-            print("\n=== Section 2: Main Demo ===")
-            main_file = demo.create_output_file("main-demo.txt")
-            with open(main_file, "w") as f:
-                f.write("Main demo phase completed\n")
-            print("Main demo phase completed")
-            
-            # Section 3: Cleanup
-            print("\n=== Section 3: Cleanup ===")
-            cleanup_file = demo.create_output_file("cleanup.txt")
-            with open(cleanup_file, "w") as f:
-                f.write("Cleanup phase completed\n")
-            print("Cleanup phase completed")
+            # All sections log to one file; a single open/write/close
+            # beats three, especially on network filesystems
+            log_file = demo.create_output_file("demo-log.txt")
+            with open(log_file, "w") as f:
+                # Section 1: Setup
+                print("\n=== Section 1: Setup ===")
+                f.write("=== Setup ===\nSetup phase completed\n")
+                print("Setup phase completed")
+
+                # Section 2: Main demo
+                print("\n=== Section 2: Main Demo ===")
+                f.write("=== Main Demo ===\nMain demo phase completed\n")
+                print("Main demo phase completed")
+
+                # Section 3: Cleanup
+                print("\n=== Section 3: Cleanup ===")
+                f.write("=== Cleanup ===\nCleanup phase completed\n")
+                print("Cleanup phase completed")
             
             print("\nMulti-section demo completed!")
     
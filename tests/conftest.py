@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the demotool test suite.
+"""
+
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+
+from demotool.images import ImageManager
+
+
+@pytest.fixture(scope="session")
+def image_manager_stub():
+    """One spec'd ImageManager stub for the whole session.
+
+    Injected into VMManager so the VM tests don't construct a real
+    ImageManager per test; callers reset it between tests and configure
+    the methods they care about.
+    """
+    stub = create_autospec(ImageManager, instance=True)
+    stub.cache_dir = Path("/tmp/demotool-test-cache")
+    return stub
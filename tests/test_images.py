@@ -11,15 +11,15 @@ IMPORTANT: Only ONE test actually runs the slow virt-builder operation:
 All other tests use mocks or test existing image logic to avoid the slow operation.
 """
 
+import json
 import os
 import shutil
 import subprocess
-import tempfile
+import uuid
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
-import xdg
 
 from demotool.images import ImageManager
 from demotool.exceptions import ImageError
@@ -32,27 +32,48 @@ logger = logging.getLogger(__name__)
 # Note: We focus on testing real ImageManager functionality rather than shared fixtures
 
 
+@pytest.fixture(scope="session")
+def _session_cache(tmp_path_factory):
+    """Session-scoped root for per-test cache directories.
+
+    One mkdtemp for the whole session instead of one per test; pytest
+    retires the tmp_path_factory root itself, so tests skip the rmtree.
+    """
+    return tmp_path_factory.mktemp("demotool-cache")
+
+
+# Canned subprocess.run success result, built once at import; the tests
+# only patch subprocess.run's return value, never assert on this object
+_RUN_OK = MagicMock(check=True)
+
+
+def _write_fake_qcow2(path: Path, size: int = 1024) -> None:
+    """Write a synthetic qcow2 header so a file passes the fast validation.
+
+    Much cheaper than forking qemu-img create for tests that only need
+    "looks like qcow2".
+    """
+    path.write_bytes(b"QFI\xfb\x00\x00\x00\x03" + b"\x00" * (size - 8))
+
+
 class TestImageManager:
     """Integration tests for ImageManager functionality."""
     
     @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary cache directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        original_cache = xdg.xdg_cache_home
-        
+    def temp_cache_dir(self, _session_cache):
+        """Provide a fresh per-test cache directory under the session root."""
+        temp_dir = _session_cache / uuid.uuid4().hex
+        temp_dir.mkdir()
+
         # Mock xdg_cache_home to return our temp directory
-        with patch('xdg.xdg_cache_home', return_value=temp_dir):
-            yield Path(temp_dir)
-        
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        with patch('xdg.xdg_cache_home', return_value=str(temp_dir)):
+            yield temp_dir
     
     @pytest.fixture
     def image_manager(self, temp_cache_dir):
         """Create an ImageManager instance with temporary cache."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            return ImageManager()
+        # temp_cache_dir already patched xdg_cache_home for the whole test
+        return ImageManager()
     
     def test_image_manager_initialization(self, image_manager, temp_cache_dir):
         """Test that ImageManager creates cache directory on initialization."""
@@ -76,32 +97,25 @@ class TestImageManager:
     
     def test_image_exists_false_when_file_not_readable(self, image_manager, temp_cache_dir):
         """Test image existence check when file exists but is not readable."""
-        # Create a non-readable file
+        # Simulate an unreadable file by failing the open() call itself;
+        # unlike chmod 0o000 this doesn't depend on filesystem semantics
         image_path = image_manager.get_image_path("test-image")
-        image_path.touch()
-        image_path.chmod(0o000)  # No permissions
-        
-        try:
+        _write_fake_qcow2(image_path)
+
+        with patch("builtins.open", side_effect=PermissionError):
             assert not image_manager.image_exists("test-image")
-        finally:
-            # Restore permissions for cleanup
-            image_path.chmod(0o644)
-    
-    @pytest.mark.skipif(
-        shutil.which("qemu-img") is None,
-        reason="qemu-img not available on system"
-    )
+
+        # The failure must not be memoized: once the file is readable again
+        # (which changes neither mtime nor size), the image is found
+        assert image_manager.image_exists("test-image")
+
     def test_image_exists_with_valid_qcow2(self, image_manager, temp_cache_dir):
         """Test image existence check with a valid qcow2 file."""
-        # Create a minimal valid qcow2 file using qemu-img
+        # A synthetic header is all the fast validation path looks at
         image_path = image_manager.get_image_path("test-valid")
-        
-        # Use qemu-img to create a minimal valid qcow2 file
-        result = os.system(f"qemu-img create -f qcow2 {image_path} 1M")
-        if result == 0:
-            assert image_manager.image_exists("test-valid")
-        else:
-            pytest.skip("qemu-img create failed")
+        _write_fake_qcow2(image_path)
+
+        assert image_manager.image_exists("test-valid")
     
     def test_image_exists_with_invalid_file(self, image_manager, temp_cache_dir):
         """Test image existence check with an invalid file."""
@@ -112,62 +126,52 @@ class TestImageManager:
         assert not image_manager.image_exists("test-invalid")
     
     def test_create_image_creates_cache_directory(self, temp_cache_dir):
-        """Test that create_image creates the cache directory structure."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            manager = ImageManager()
-            
-            # Verify directory was created
-            expected_cache = temp_cache_dir / "demotool" / "images"
-            assert expected_cache.exists()
-            assert expected_cache.is_dir()
+        """Test that create_base_image creates the cache directory structure."""
+        ImageManager()
+
+        # Verify directory was created
+        expected_cache = temp_cache_dir / "demotool" / "images"
+        assert expected_cache.exists()
+        assert expected_cache.is_dir()
     
 
     
     def test_create_image_reuses_existing_valid_image(self, image_manager, temp_cache_dir):
-        """Test that create_image reuses existing valid images."""
+        """Test that create_base_image reuses existing valid images."""
         image_id = "test-reuse"
         image_path = image_manager.get_image_path(image_id)
-        
-        # Create a mock valid image
-        with patch.object(image_manager, 'image_exists', return_value=True):
-            result_path = image_manager.create_image(image_id)
-            
+        image_path.touch()
+
+        # Mock the validation to consider the existing image valid
+        with patch.object(image_manager, '_is_valid_qcow2', return_value=True):
+            result_path = image_manager.create_base_image(image_id)
+
             # Should return the existing path without creating new image
             assert result_path == image_path
     
     def test_create_image_deletes_corrupted_image(self, image_manager, temp_cache_dir):
-        """Test that create_image deletes corrupted images before recreating."""
+        """Test that create_base_image deletes corrupted images before recreating."""
         image_id = "test-corrupted"
         image_path = image_manager.get_image_path(image_id)
         
         # Create a corrupted image file
-        image_path.write_text("corrupted data")
+        image_path.write_bytes(b"corrupted data")
         
-        # Mock virt-builder to succeed
+        # Mock virt-builder to succeed; the real NamedTemporaryFile stages
+        # the (empty) build output, which os.replace then publishes over
+        # the corrupted file
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(check=True)
-            
-            # Mock the temporary file creation with a different path
-            temp_path = temp_cache_dir / "temp_image.qcow2"
-            with patch('tempfile.NamedTemporaryFile') as mock_temp:
-                mock_temp.return_value.__enter__.return_value.name = str(temp_path)
-                mock_temp.return_value.__exit__.return_value = None
-                
-                # Create the temp file so rename can work
-                temp_path.touch()
-                
-                # Mock the image validation to consider the corrupted image invalid
-                with patch.object(image_manager, 'image_exists', return_value=False):
-                    result_path = image_manager.create_image(image_id)
-                    
-                    # The corrupted image should be deleted during the process
-                    # but then recreated by the rename operation
-                    # So we verify the final result is correct
-                    assert result_path.exists()
-                    assert result_path == image_path
-                    
-                    # Verify the content is not the corrupted data
-                    assert result_path.read_text() != "corrupted data"
+            mock_run.return_value = _RUN_OK
+
+            # Mock the image validation to consider the corrupted image invalid
+            with patch.object(image_manager, '_is_valid_qcow2', return_value=False):
+                result_path = image_manager.create_base_image(image_id)
+
+        # The corrupted image was deleted and the staged build renamed
+        # into its place
+        assert result_path == image_path
+        assert result_path.exists()
+        assert result_path.read_bytes() != b"corrupted data"
     
     def test_create_image_virt_builder_failure(self, image_manager, temp_cache_dir):
         """Test image creation failure handling."""
@@ -178,21 +182,73 @@ class TestImageManager:
             mock_run.side_effect = Exception("virt-builder failed")
             
             with pytest.raises(ImageError, match="Failed to create image"):
-                image_manager.create_image(image_id)
+                image_manager.create_base_image(image_id)
     
-    def test_firstboot_commands_generation(self, image_manager):
-        """Test that firstboot commands are properly formatted."""
-        commands = image_manager._get_firstboot_commands()
-        
-        # Verify all required commands are present
-        assert "useradd -m -s /bin/bash demo" in commands
-        assert "echo 'demo:demokudasaidomo' | chpasswd" in commands
-        assert "usermod -a -G wheel demo" in commands
-        assert "AutomaticLogin=demo" in commands
-        assert "AutomaticLoginEnable=true" in commands
-        
-        # Verify commands are semicolon-separated
-        assert ";" in commands
+    def test_create_overlay_invokes_qemu_img(self, image_manager, temp_cache_dir):
+        """Test that create_overlay builds a CoW overlay with qemu-img."""
+        base_path = image_manager.get_image_path("test-base")
+        dest_path = image_manager.cache_dir / "test-overlay.qcow2"
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = _RUN_OK
+
+            result_path = image_manager.create_overlay(base_path, dest_path)
+
+            assert result_path == dest_path
+            # The overlay is built under a temp name and renamed into place
+            assert dest_path.exists()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[:4] == ["qemu-img", "create", "-f", "qcow2"]
+            assert str(base_path) in cmd
+            assert cmd[-1].endswith(".partial")
+
+    def test_create_overlay_failure(self, image_manager, temp_cache_dir):
+        """Test overlay creation failure handling."""
+        base_path = image_manager.get_image_path("test-base")
+        dest_path = image_manager.cache_dir / "test-overlay.qcow2"
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "qemu-img")
+
+            with pytest.raises(ImageError, match="Failed to create overlay"):
+                image_manager.create_overlay(base_path, dest_path)
+
+    def test_create_overlay_reuses_matching_overlay(self, image_manager, temp_cache_dir):
+        """Test that an intact overlay backed by the right base is reused."""
+        base_path = image_manager.get_image_path("test-base")
+        dest_path = image_manager.cache_dir / "test-overlay.qcow2"
+        dest_path.touch()
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps({
+                    "format": "qcow2",
+                    "backing-filename": str(base_path),
+                }).encode()
+            )
+
+            result_path = image_manager.create_overlay(base_path, dest_path)
+
+            assert result_path == dest_path
+            # Only the qemu-img info probe ran; no new overlay was created
+            mock_run.assert_called_once()
+            assert "info" in mock_run.call_args[0][0]
+
+    def test_firstboot_script_generation(self, image_manager):
+        """Test that the firstboot script is properly formatted."""
+        # One set-membership check covers all required commands
+        commands = set(image_manager._firstboot_command_list())
+        assert {
+            "useradd -m -s /bin/bash demo",
+            "echo 'demo:demokudasaidomo' | chpasswd",
+            "usermod -a -G wheel demo",
+            "echo 'AutomaticLogin=demo' >> /etc/gdm/custom.conf.d/autologin.conf",
+            "echo 'AutomaticLoginEnable=true' >> /etc/gdm/custom.conf.d/autologin.conf",
+        }.issubset(commands)
+
+        # Verify it's a shell script that stops on the first failure
+        script = image_manager._get_firstboot_script()
+        assert script.startswith("#!/bin/sh\nset -e\n")
     
     def test_cleanup_corrupted_images(self, image_manager, temp_cache_dir):
         """Test cleanup of corrupted images."""
@@ -204,7 +260,7 @@ class TestImageManager:
         ]
         
         for img_path in corrupted_images:
-            img_path.write_text("corrupted data")
+            img_path.write_bytes(b"corrupted data")
         
         # Create one valid image
         valid_image = image_manager.get_image_path("valid")
@@ -220,149 +276,180 @@ class TestImageManager:
             
             # Verify valid image remains
             assert valid_image.exists()
-    
+
+    def test_cleanup_skips_overlays_and_reaps_pool_orphans(self, image_manager,
+                                                           temp_cache_dir):
+        """Test that cleanup ignores per-VM overlays and reaps pool orphans."""
+        vm_overlay = image_manager.cache_dir / "demo-test.overlay.qcow2"
+        vm_overlay.write_bytes(b"not a qcow2 header")
+        orphan = image_manager.cache_dir / "fedora-42.pool-xyz.overlay.qcow2"
+        orphan.write_bytes(b"not a qcow2 header")
+        skeleton = image_manager.cache_dir / "demo-pool-deadbeef.overlay.qcow2"
+        skeleton.write_bytes(b"not a qcow2 header")
+
+        with patch.object(image_manager, '_is_valid_qcow2') as mock_check:
+            image_manager.cleanup_corrupted_images()
+
+        # Overlays are disposable copies, not base images: the in-use one
+        # must survive the corruption scan, both kinds of pool orphan go
+        mock_check.assert_not_called()
+        assert vm_overlay.exists()
+        assert not orphan.exists()
+        assert not skeleton.exists()
+
     def test_is_valid_qcow2_with_valid_file(self, image_manager, temp_cache_dir):
         """Test qcow2 validation with a valid file."""
-        # Create a mock valid qcow2 file
+        # Create a file with a valid qcow2 header (magic + version 3)
         image_path = image_manager.get_image_path("test-valid")
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                check=True,
-                stdout="file format: qcow2\nother info"
-            )
-            
-            assert image_manager._is_valid_qcow2(image_path)
-    
+        image_path.write_bytes(b"QFI\xfb" + (3).to_bytes(4, "big"))
+
+        assert image_manager._is_valid_qcow2(image_path)
+
     def test_is_valid_qcow2_with_invalid_file(self, image_manager, temp_cache_dir):
         """Test qcow2 validation with an invalid file."""
         image_path = image_manager.get_image_path("test-invalid")
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                check=True,
-                stdout="file format: raw\nother info"
-            )
-            
-            assert not image_manager._is_valid_qcow2(image_path)
-    
-    def test_is_valid_qcow2_with_subprocess_failure(self, image_manager, temp_cache_dir):
-        """Test qcow2 validation when subprocess fails."""
+        image_path.write_text("This is not a qcow2 file")
+
+        assert not image_manager._is_valid_qcow2(image_path)
+
+    def test_is_valid_qcow2_with_unsupported_version(self, image_manager, temp_cache_dir):
+        """Test qcow2 validation rejects unknown header versions."""
+        image_path = image_manager.get_image_path("test-bad-version")
+        image_path.write_bytes(b"QFI\xfb" + (7).to_bytes(4, "big"))
+
+        assert not image_manager._is_valid_qcow2(image_path)
+
+    def test_is_valid_qcow2_with_missing_file(self, image_manager, temp_cache_dir):
+        """Test qcow2 validation when the file doesn't exist."""
+        image_path = image_manager.get_image_path("test-missing")
+
+        assert not image_manager._is_valid_qcow2(image_path)
+
+    def test_deep_check_qcow2_with_subprocess_failure(self, image_manager, temp_cache_dir):
+        """Test deep qcow2 validation when qemu-img is unavailable."""
         image_path = image_manager.get_image_path("test-failure")
-        
+
         with patch('subprocess.run') as mock_run:
             mock_run.side_effect = FileNotFoundError("qemu-img not found")
-            
-            assert not image_manager._is_valid_qcow2(image_path)
+
+            assert not image_manager._deep_check_qcow2(image_path)
     
     def test_image_manager_cleanup_on_destruction(self, temp_cache_dir):
-        """Test that ImageManager cleanup works properly."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            manager = ImageManager()
-            cache_dir = manager.cache_dir
-            
-            # Verify directory exists
-            assert cache_dir.exists()
-            
-            # Delete manager
-            del manager
-            
-            # Directory should still exist (it's not automatically cleaned up)
-            assert cache_dir.exists()
+        """Test that dropping an ImageManager leaves the cache in place."""
+        manager = ImageManager()
+        cache_dir = manager.cache_dir
 
+        # Verify directory exists
+        assert cache_dir.exists()
 
+        # The guarantee is that no destructor removes the cache; asserting
+        # there is no __del__ at all avoids depending on refcount/GC timing
+        assert not hasattr(ImageManager, "__del__")
+        assert cache_dir.exists()
+
+
+# The unit tests above are fully independent (per-test cache dirs via
+# tmp_path_factory), so pytest-xdist can spread them freely; only the
+# bandwidth-bound virt-builder tests are pinned to a single worker
+@pytest.mark.xdist_group("virt-builder")
 class TestImageManagerIntegration:
     """Integration tests that require actual system tools."""
-    
+
     @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary cache directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        
+    def temp_cache_dir(self, _session_cache):
+        """Provide a fresh per-test cache directory under the session root."""
+        temp_dir = _session_cache / uuid.uuid4().hex
+        temp_dir.mkdir()
+
         # Mock xdg_cache_home to return our temp directory
-        with patch('xdg.xdg_cache_home', return_value=temp_dir):
-            yield Path(temp_dir)
-        
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        with patch('xdg.xdg_cache_home', return_value=str(temp_dir)):
+            yield temp_dir
     
     def test_existing_image_detection_and_reuse(self, temp_cache_dir):
         """Test that ImageManager detects existing images and reuses them."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            manager = ImageManager()
-            
-            # Test the existing image detection logic
-            image_id = "test-existing"
-            
-            # Create a test image file to simulate existing image
-            image_path = manager.get_image_path(image_id)
-            image_path.parent.mkdir(parents=True, exist_ok=True)
-            image_path.touch()
-            
-            # Mock the image validation to consider this a valid image
-            with patch.object(manager, 'image_exists', return_value=True):
-                # Test that our library detects existing image
-                result_path = manager.create_image(image_id)
-                
-                # Verify the image was found and returned
-                assert result_path.exists()
-                assert result_path.suffix == ".qcow2"
-                assert result_path == image_path
-                
-                # Verify image validation works
-                assert manager.image_exists(image_id)
-                
-                # Test image reuse (should return same path without virt-builder)
-                result_path2 = manager.create_image(image_id)
-                assert result_path2 == image_path
-                
-                # This test verifies the real ImageManager logic for existing images
+        manager = ImageManager()
+
+        # Test the existing image detection logic
+        image_id = "test-existing"
+
+        # Create a test image file to simulate existing image
+        image_path = manager.get_image_path(image_id)
+        image_path.parent.mkdir(parents=True, exist_ok=True)
+        image_path.touch()
+
+        # Mock the image validation to consider this a valid image
+        with patch.object(manager, '_is_valid_qcow2', return_value=True):
+            # Test that our library detects existing image
+            result_path = manager.create_base_image(image_id)
+
+            # Verify the image was found and returned
+            assert result_path.exists()
+            assert result_path.suffix == ".qcow2"
+            assert result_path == image_path
+
+            # Verify image validation works
+            assert manager.image_exists(image_id)
+
+            # Test image reuse (should return same path without virt-builder)
+            result_path2 = manager.create_base_image(image_id)
+            assert result_path2 == image_path
+
+            # This test verifies the real ImageManager logic for existing images
     
     @pytest.mark.skipif(
         shutil.which("virt-builder") is None,
         reason="virt-builder not available"
     )
     def test_create_image_with_virt_builder_fedora_only(self, temp_cache_dir):
-        """Test image creation using actual ImageManager.create_image method (Fedora only)."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            manager = ImageManager()
-            
-            # Try to create a Fedora image using the actual ImageManager method
-            # This will test the real library code with virt-builder
-            fedora_templates = ["fedora-42", "fedora-41", "fedora-40"]
-            created_image = None
-            image_id = None
-            
-            for template in fedora_templates:
-                try:
-                    # Check if template exists
-                    result = os.system(f"virt-builder --list | grep -q {template}")
-                    if result == 0:
-                        logger.info(f"Testing ImageManager.create_image with {template}")
-                        
-                        # This calls the REAL ImageManager.create_image method
-                        # which will use virt-builder with full customization
-                        created_image = manager.create_image(template)
-                        image_id = template
-                        logger.info(f"Successfully created Fedora image: {template}")
-                        break
-                            
-                except Exception as e:
-                    logger.warning(f"Error creating image {template}: {e}")
-                    continue
-            
-            if created_image is None:
-                pytest.skip("Could not create any Fedora image with ImageManager.create_image")
-            
-            # Verify the image was created by our library
-            assert created_image.exists()
-            assert created_image.is_file()
-            assert created_image.suffix == ".qcow2"
-            
-            # Verify it's a valid qcow2 image using our library's validation
-            assert manager.image_exists(image_id)
-            
-            # This test actually tested the real ImageManager code!
+        """Test image creation using actual ImageManager.create_base_image method (Fedora only)."""
+        manager = ImageManager()
+
+        # Try to create a Fedora image using the actual ImageManager method
+        # This will test the real library code with virt-builder
+        fedora_templates = ["fedora-42", "fedora-41", "fedora-40"]
+        created_image = None
+        image_id = None
+
+        # One virt-builder --list run instead of a shell+grep pipeline per
+        # candidate template
+        try:
+            out = subprocess.run(
+                ["virt-builder", "--list"],
+                capture_output=True, text=True, check=True
+            ).stdout
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pytest.skip("virt-builder --list failed")
+        available = {line.split()[0] for line in out.splitlines() if line.strip()}
+
+        for template in fedora_templates:
+            if template not in available:
+                continue
+            try:
+                logger.info(f"Testing ImageManager.create_base_image with {template}")
+
+                # This calls the REAL ImageManager.create_base_image method
+                # which will use virt-builder with full customization
+                created_image = manager.create_base_image(template)
+                image_id = template
+                logger.info(f"Successfully created Fedora image: {template}")
+                break
+
+            except Exception as e:
+                logger.warning(f"Error creating image {template}: {e}")
+                continue
+
+        if created_image is None:
+            pytest.skip("Could not create any Fedora image with ImageManager.create_image")
+
+        # Verify the image was created by our library
+        assert created_image.exists()
+        assert created_image.is_file()
+        assert created_image.suffix == ".qcow2"
+
+        # Verify it's a valid qcow2 image using our library's validation
+        assert manager.image_exists(image_id)
+
+        # This test actually tested the real ImageManager code!
     
 
     
@@ -374,19 +461,18 @@ class TestImageManagerIntegration:
     )
     def test_qcow2_validation_with_real_tool(self, temp_cache_dir):
         """Test qcow2 validation using actual qemu-img tool."""
-        with patch('xdg.xdg_cache_home', return_value=str(temp_cache_dir)):
-            manager = ImageManager()
-            
-            # Create a real qcow2 file
-            image_path = manager.get_image_path("test-real")
-            
-            # Use qemu-img to create a minimal valid qcow2 file
-            result = os.system(f"qemu-img create -f qcow2 {image_path} 1M")
-            if result == 0:
-                # Test validation
-                assert manager._is_valid_qcow2(image_path)
-                
-                # Test that image_exists recognizes it
-                assert manager.image_exists("test-real")
-            else:
-                pytest.skip("qemu-img create failed")
+        manager = ImageManager()
+
+        # Create a real qcow2 file
+        image_path = manager.get_image_path("test-real")
+
+        # Use qemu-img to create a minimal valid qcow2 file
+        result = os.system(f"qemu-img create -f qcow2 {image_path} 1M")
+        if result == 0:
+            # Test validation
+            assert manager._is_valid_qcow2(image_path)
+
+            # Test that image_exists recognizes it
+            assert manager.image_exists("test-real")
+        else:
+            pytest.skip("qemu-img create failed")
@@ -10,15 +10,37 @@ from unittest.mock import patch
 
 import pytest
 
-from demotool.logging import FileLineFormatter, setup_logging, get_logger
+from demotool.logging import LOG_FORMAT, setup_logging, get_logger
 
 
-class TestFileLineFormatter:
-    """Test the FileLineFormatter class."""
-    
-    def test_format_with_filename_lineno(self):
-        """Test formatting with filename and line number."""
-        formatter = FileLineFormatter()
+@pytest.fixture(autouse=True)
+def _reset_demotool_logger():
+    """Start each test with a pristine demotool logger and restore it after.
+
+    The "demotool" logger is process-global, so without this the tests
+    would leak handlers and the configured-state sentinel into each other.
+    """
+    logger = logging.getLogger("demotool")
+    saved = (logger.level, list(logger.handlers),
+             getattr(logger, "_demotool_handler", None))
+    logger.handlers.clear()
+    if saved[2] is not None:
+        del logger._demotool_handler
+    yield
+    logger.setLevel(saved[0])
+    logger.handlers[:] = saved[1]
+    if saved[2] is not None:
+        logger._demotool_handler = saved[2]
+    elif hasattr(logger, "_demotool_handler"):
+        del logger._demotool_handler
+
+
+class TestLogFormat:
+    """Test the log record format."""
+
+    def test_format_includes_filename_lineno(self):
+        """Test formatting includes filename and line number."""
+        formatter = logging.Formatter(LOG_FORMAT)
         record = logging.LogRecord(
             name="test",
             level=logging.INFO,
@@ -28,25 +50,9 @@ class TestFileLineFormatter:
             args=(),
             exc_info=None
         )
-        
+
         result = formatter.format(record)
         assert result == "INFO: test.py:42: Test message"
-    
-    def test_format_without_filename_lineno(self):
-        """Test formatting without filename and line number."""
-        formatter = FileLineFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        
-        result = formatter.format(record)
-        assert result == "ERROR: unknown:0: Test message"
 
 
 class TestSetupLogging:
@@ -90,10 +96,22 @@ class TestSetupLogging:
         """Test that multiple calls don't create duplicate handlers."""
         setup_logging()
         setup_logging()
-        
+
         logger = logging.getLogger("demotool")
         assert len(logger.handlers) == 1
 
+    def test_setup_logging_level_change_keeps_handler(self):
+        """Test that a level change updates in place without handler churn."""
+        setup_logging("INFO")
+        logger = logging.getLogger("demotool")
+        handler = logger.handlers[0]
+
+        setup_logging("DEBUG")
+
+        assert logger.level == logging.DEBUG
+        assert logger.handlers == [handler]
+        assert handler.level == logging.DEBUG
+
 
 class TestGetLogger:
     """Test the get_logger function."""
@@ -0,0 +1,142 @@
+"""
+Tests for the overlay pooling functionality.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from demotool.pool import OverlayPool, VMPool
+from demotool.exceptions import ImageError, VMError
+
+
+class TestOverlayPool:
+    """Unit tests for OverlayPool functionality."""
+
+    @pytest.fixture
+    def image_manager(self, tmp_path):
+        """Create a mock ImageManager backed by a real temp directory."""
+        manager = MagicMock()
+        manager.cache_dir = tmp_path
+        manager.create_base_image.return_value = tmp_path / "base.qcow2"
+        manager.create_overlay.side_effect = lambda base, dest: dest
+        return manager
+
+    @pytest.fixture
+    def pool(self, image_manager):
+        """Create an OverlayPool with the mocked ImageManager."""
+        return OverlayPool(image_manager=image_manager)
+
+    def test_acquire_empty_pool_creates_synchronously(self, pool, image_manager):
+        """Test that acquire falls back to synchronous overlay creation."""
+        overlay_path = pool.acquire("fedora-42")
+
+        assert overlay_path.name.startswith("fedora-42.pool-")
+        assert overlay_path.name.endswith(".overlay.qcow2")
+        image_manager.create_base_image.assert_called_with("fedora-42")
+        image_manager.create_overlay.assert_called()
+
+    def test_acquire_returns_pooled_overlay(self, pool, image_manager):
+        """Test that a pre-filled pool serves overlays without new creation."""
+        pooled_path = Path("/pooled/overlay.qcow2")
+        pool._queue_for("fedora-42").put_nowait(pooled_path)
+
+        overlay_path = pool.acquire("fedora-42")
+
+        assert overlay_path == pooled_path
+
+    def test_fill_stops_at_pool_size(self, pool, image_manager):
+        """Test that _fill tops the queue up to the configured size."""
+        pool._fill("fedora-42")
+
+        q = pool._queue_for("fedora-42")
+        assert q.qsize() == pool.size
+        assert q.full()
+
+    def test_fill_stops_on_image_error(self, pool, image_manager):
+        """Test that _fill gives up when overlay creation fails."""
+        image_manager.create_overlay.side_effect = ImageError("qemu-img failed")
+
+        pool._fill("fedora-42")
+
+        assert pool._queue_for("fedora-42").empty()
+
+    def test_queues_are_per_image_id(self, pool):
+        """Test that each image_id gets its own overlay queue."""
+        q1 = pool._queue_for("fedora-42")
+        q2 = pool._queue_for("fedora-41")
+
+        assert q1 is not q2
+        assert pool._queue_for("fedora-42") is q1
+
+
+class TestVMPool:
+    """Unit tests for VMPool functionality."""
+
+    @pytest.fixture
+    def vm_manager(self, tmp_path):
+        """Create a mock VMManager backed by a real temp directory."""
+        manager = MagicMock()
+        manager.image_manager.cache_dir = tmp_path
+        manager.image_manager.create_base_image.return_value = tmp_path / "base.qcow2"
+        manager.image_manager.create_overlay.side_effect = lambda base, dest: dest
+        manager._boot_vm.return_value = (MagicMock(), 5900)
+        return manager
+
+    @pytest.fixture
+    def pool(self, vm_manager):
+        """Create a VMPool of size 1 with the mocked VMManager."""
+        return VMPool(vm_manager, size=1)
+
+    def test_acquire_disabled_pool_returns_none(self, vm_manager):
+        """Test that a size-0 pool never serves or boots VMs."""
+        pool = VMPool(vm_manager, size=0)
+
+        assert pool.acquire("fedora-42") is None
+        vm_manager._boot_vm.assert_not_called()
+
+    def test_acquire_empty_pool_returns_none(self, pool, vm_manager):
+        """Test that a miss returns None instead of booting synchronously."""
+        assert pool.acquire("fedora-42") is None
+
+    def test_acquire_returns_pooled_vm(self, pool):
+        """Test that a pre-filled pool serves warm VMs."""
+        warm = (MagicMock(), Path("/pooled/overlay.qcow2"), 5901)
+        pool._queue_for("fedora-42").put_nowait(warm)
+
+        assert pool.acquire("fedora-42") == warm
+
+    def test_close_destroys_queued_vms(self, pool, vm_manager, tmp_path):
+        """Test that close drains the pool and destroys skeleton VMs."""
+        warm_vm = MagicMock()
+        warm_vm.name.return_value = "demo-pool-deadbeef"
+        overlay = tmp_path / "demo-pool-deadbeef.overlay.qcow2"
+        overlay.touch()
+        pool._queue_for("fedora-42").put_nowait((warm_vm, overlay, 5901))
+
+        pool.close()
+
+        vm_manager._destroy_domain.assert_called_once_with(
+            warm_vm, "demo-pool-deadbeef"
+        )
+        assert not overlay.exists()
+        assert pool._queue_for("fedora-42").empty()
+
+    def test_fill_boots_skeleton_vm(self, pool, vm_manager):
+        """Test that _fill boots pool-named skeleton VMs up to size."""
+        pool._fill("fedora-42")
+
+        q = pool._queue_for("fedora-42")
+        assert q.full()
+        vm_name, overlay_path = vm_manager._boot_vm.call_args[0]
+        assert vm_name.startswith("demo-pool-")
+        assert overlay_path.name == f"{vm_name}.overlay.qcow2"
+
+    def test_fill_stops_on_boot_error(self, pool, vm_manager):
+        """Test that _fill gives up when a skeleton VM fails to boot."""
+        vm_manager._boot_vm.side_effect = VMError("boot failed")
+
+        pool._fill("fedora-42")
+
+        assert pool._queue_for("fedora-42").empty()